@@ -0,0 +1,76 @@
+"""
+ATS Core — Numba Indicator Kernels
+
+JIT-compiled fast paths for core.indicators. Importing this module requires
+numba; core.indicators falls back to its ta-lib implementations when numba
+is not installed, or when ATS_DISABLE_JIT is set to a non-zero value.
+
+No Freqtrade imports permitted in this file.
+"""
+
+import math
+import os
+
+if os.environ.get("ATS_DISABLE_JIT", "0") != "0":
+    raise ImportError("numba kernels disabled by ATS_DISABLE_JIT")
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def bollinger_kernel(typical, window, stds):
+    """
+    Single-pass rolling mean / sample std Bollinger Bands.
+
+    Maintains a running mean and sum of squared deviations (Welford
+    add/remove updates, as pandas' rolling var does) so each element is
+    read once. Windows containing NaN, and the first window-1 positions,
+    are left as NaN to match rolling(window, min_periods=window).
+
+    Args:
+        typical: Contiguous float64 array of typical prices.
+        window: Rolling window length.
+        stds: Standard deviation multiplier.
+
+    Returns:
+        Tuple of (upper, middle, lower) float64 arrays.
+    """
+    n = typical.shape[0]
+    upper = np.full(n, np.nan)
+    mid = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        val = typical[i]
+        if not math.isnan(val):
+            nobs += 1
+            delta = val - mean
+            mean += delta / nobs
+            ssqdm += ((nobs - 1) * delta * delta) / nobs
+
+        if i >= window:
+            old = typical[i - window]
+            if not math.isnan(old):
+                if nobs == 1:
+                    nobs = 0
+                    mean = 0.0
+                    ssqdm = 0.0
+                else:
+                    nobs -= 1
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= ((nobs + 1) * delta * delta) / nobs
+
+        if nobs == window:
+            mid[i] = mean
+            if window > 1:
+                sd = math.sqrt(max(ssqdm, 0.0) / (window - 1))
+                upper[i] = mean + stds * sd
+                lower[i] = mean - stds * sd
+
+    return upper, mid, lower
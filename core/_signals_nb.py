@@ -0,0 +1,75 @@
+"""
+ATS Core — Numba Signal Kernels
+
+JIT-compiled fused kernels for core.signals. Importing this module requires
+numba; core.signals falls back to its NumPy masks when numba is not
+installed, or when ATS_DISABLE_JIT is set to a non-zero value (skips the
+numba import and warm-up compile, e.g. for short-lived workers).
+
+fastmath is deliberately not enabled: it assumes no NaNs, and RSI/TEMA
+arrays begin with a NaN warm-up that must compare False.
+
+No Freqtrade imports permitted in this file.
+"""
+
+import os
+
+if os.environ.get("ATS_DISABLE_JIT", "0") != "0":
+    raise ImportError("numba kernels disabled by ATS_DISABLE_JIT")
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def entry_kernel(r, t, m, v, rsi_threshold, out):
+    """
+    Write check_entry_long conditions into out in a single pass.
+
+    Args:
+        r, t, m, v: Aligned RSI, TEMA, BB middle and volume arrays
+            (float64, or float32 for the check_*_f32 entry points).
+        rsi_threshold: RSI level to cross above.
+        out: Preallocated boolean array of the same length.
+    """
+    n = r.shape[0]
+    if n == 0:
+        return
+    out[0] = False
+    for i in range(1, n):
+        out[i] = (
+            (r[i] > rsi_threshold)
+            & (r[i - 1] <= rsi_threshold)
+            & (t[i] <= m[i])
+            & (t[i] > t[i - 1])
+            & (v[i] > 0.0)
+        )
+
+
+@njit(cache=True, nogil=True)
+def exit_kernel(r, t, m, v, rsi_threshold, out):
+    """Write check_exit_long conditions into out in a single pass."""
+    n = r.shape[0]
+    if n == 0:
+        return
+    out[0] = False
+    for i in range(1, n):
+        out[i] = (
+            (r[i] > rsi_threshold)
+            & (r[i - 1] <= rsi_threshold)
+            & (t[i] > m[i])
+            & (t[i] < t[i - 1])
+            & (v[i] > 0.0)
+        )
+
+
+def _warm_up() -> None:
+    """Compile (or load from cache) at import so the first live call is fast."""
+    out = np.empty(4, dtype=np.bool_)
+    for dtype in (np.float64, np.float32):
+        dummy = np.zeros(4, dtype=dtype)
+        entry_kernel(dummy, dummy, dummy, dummy, 0.0, out)
+        exit_kernel(dummy, dummy, dummy, dummy, 0.0, out)
+
+
+_warm_up()
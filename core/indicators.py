@@ -2,21 +2,114 @@
 ATS Core — Technical Indicator Functions
 
 Pure mathematical indicator calculations with zero execution-engine dependency.
-These functions accept pandas Series/DataFrames and return pandas Series.
+The public functions accept pandas Series/DataFrames and return pandas Series.
+Each is a thin wrapper over a private ndarray kernel (``_*_np``) so callers
+that already hold raw arrays can skip pandas construction entirely.
+rsi() and tema() reuse their last results for an unchanged float64 close
+buffer; call clear_cache() after modifying a close buffer in place.
 
-Dependencies: pandas, ta-lib (via talib)
+Dependencies: pandas, ta-lib (via talib); numba optional (JIT fast paths)
 No Freqtrade imports permitted in this file.
 """
 
+import weakref
+
 import pandas as pd
 import numpy as np
 import talib
 
+try:
+    from core._indicators_nb import bollinger_kernel as _bollinger_nb
+except ImportError:  # numba is optional; fall back to ta-lib
+    _bollinger_nb = None
+
+
+def _as_array(values) -> np.ndarray:
+    """Return values as a contiguous float64 ndarray (no copy if already one)."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+# Recent rsi()/tema() results, keyed by (kernel, buffer address, length,
+# period, first and last value bits). Only inputs used in place (already
+# contiguous float64) are cached; converted copies get a fresh address
+# every call, so they could never hit. Entries hold a weak reference to
+# the array owning the input memory rather than the input itself: nothing
+# is kept alive, and an entry is dropped as soon as that memory is freed,
+# before its address can be reused. Outputs are bounded by total bytes.
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_cache: dict[tuple, tuple[weakref.ref, np.ndarray]] = {}
+_cache_bytes = 0
+
+
+def _memory_owner(values: np.ndarray) -> np.ndarray:
+    """The outermost ndarray in values' base chain (keeps its memory alive)."""
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def _drop(key: tuple) -> None:
+    global _cache_bytes
+    entry = _cache.pop(key, None)
+    if entry is not None:
+        _cache_bytes -= entry[1].nbytes
+
+
+def _cached(kernel, close, period: int) -> np.ndarray:
+    """Run kernel on close as float64, reusing the result for an unchanged input."""
+    global _cache_bytes
+    raw = np.asarray(close)
+    values = _as_array(raw)
+    if values is not raw or values.shape[0] == 0:
+        return kernel(values, period)
+
+    # Endpoints as raw bits: a NaN float never compares equal to itself
+    key = (
+        kernel.__name__, values.ctypes.data, values.shape[0], period,
+        values[[0, -1]].tobytes(),
+    )
+    hit = _cache.get(key)
+    if hit is not None and hit[0]() is not None:
+        return hit[1]
+
+    out = kernel(values, period)
+    if out.nbytes > _CACHE_MAX_BYTES:
+        return out
+
+    def on_free(ref, key=key):
+        entry = _cache.get(key)
+        if entry is not None and entry[0] is ref:
+            _drop(key)
+
+    _drop(key)
+    while _cache and _cache_bytes + out.nbytes > _CACHE_MAX_BYTES:
+        _drop(next(iter(_cache)))
+    _cache[key] = (weakref.ref(_memory_owner(values), on_free), out)
+    _cache_bytes += out.nbytes
+    return out
+
+
+def clear_cache() -> None:
+    """
+    Drop cached rsi()/tema() results.
+
+    Only needed if a close buffer is modified in place between calls —
+    a new or resized DataFrame is detected automatically.
+    """
+    global _cache_bytes
+    _cache.clear()
+    _cache_bytes = 0
+
 
 # ---------------------------------------------------------------------------
 # Momentum Indicators
 # ---------------------------------------------------------------------------
 
+def _rsi_np(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """RSI over a contiguous float64 array."""
+    return talib.RSI(close, timeperiod=period)
+
+
 def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """
     Relative Strength Index.
@@ -28,13 +121,19 @@ def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         Series of RSI values (0-100).
     """
-    return pd.Series(talib.RSI(close.values, timeperiod=period), index=close.index)
+    # Copy out of the cache so callers may modify the returned Series
+    return pd.Series(_cached(_rsi_np, close, period), index=close.index, copy=True)
 
 
 # ---------------------------------------------------------------------------
 # Overlap / Moving Average Indicators
 # ---------------------------------------------------------------------------
 
+def _tema_np(close: np.ndarray, period: int = 9) -> np.ndarray:
+    """TEMA over a contiguous float64 array."""
+    return talib.TEMA(close, timeperiod=period)
+
+
 def tema(close: pd.Series, period: int = 9) -> pd.Series:
     """
     Triple Exponential Moving Average.
@@ -46,7 +145,55 @@ def tema(close: pd.Series, period: int = 9) -> pd.Series:
     Returns:
         Series of TEMA values.
     """
-    return pd.Series(talib.TEMA(close.values, timeperiod=period), index=close.index)
+    return pd.Series(_cached(_tema_np, close, period), index=close.index, copy=True)
+
+
+def _sample_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1), matching pandas rolling().std()."""
+    if window < 2:
+        return np.full(values.shape[0], np.nan)
+    # ta-lib STDDEV is the population std; rescale to the sample std.
+    return talib.STDDEV(values, timeperiod=window, nbdev=1.0) * np.sqrt(window / (window - 1))
+
+
+def _bollinger_np(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    window: int = 20,
+    stds: float = 2.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands on typical price over contiguous float64 arrays."""
+    # Typical price built in one buffer rather than three temporaries
+    typical = np.add(high, low)
+    typical += close
+    typical /= 3.0
+
+    if _bollinger_nb is not None:
+        return _bollinger_nb(typical, int(window), float(stds))
+
+    missing = np.isnan(typical)
+    if not missing.any():
+        mid = talib.SMA(typical, timeperiod=window)
+        std = _sample_std(typical, window)
+    else:
+        # ta-lib carries a NaN forward forever; rolling(min_periods=window)
+        # recovers `window` bars later. Windows containing a NaN are NaN
+        # either way, so run ta-lib on each NaN-free stretch separately.
+        mid = np.full(typical.shape[0], np.nan)
+        std = np.full(typical.shape[0], np.nan)
+        edges = np.flatnonzero(np.diff(np.concatenate(([True], missing, [True]))))
+        starts, ends = edges[::2], edges[1::2]
+        for start, end in zip(starts, ends):
+            if end - start >= window:
+                segment = typical[start:end]
+                mid[start:end] = talib.SMA(segment, timeperiod=window)
+                std[start:end] = _sample_std(segment, window)
+
+    upper = mid + (stds * std)
+    lower = mid - (stds * std)
+
+    return upper, mid, lower
 
 
 def bollinger_bands(
@@ -77,21 +224,40 @@ def bollinger_bands(
     Returns:
         Tuple of (upper_band, middle_band, lower_band) as Series.
     """
-    typical = (high + low + close) / 3.0
-
-    mid = typical.rolling(window=window, min_periods=window).mean()
-    std = typical.rolling(window=window, min_periods=window).std()
-
-    upper = mid + (stds * std)
-    lower = mid - (stds * std)
-
-    return upper, mid, lower
+    upper, mid, lower = _bollinger_np(
+        _as_array(high), _as_array(low), _as_array(close), window, stds
+    )
+    index = close.index
+    return (
+        pd.Series(upper, index=index, copy=False),
+        pd.Series(mid, index=index, copy=False),
+        pd.Series(lower, index=index, copy=False),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Utility Functions
 # ---------------------------------------------------------------------------
 
+def _crossed_above_np(values: np.ndarray, threshold) -> np.ndarray:
+    """Crossover mask over a float64 array vs a scalar or an aligned array."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=bool)
+    if n == 0:
+        return out
+    scalar = np.ndim(threshold) == 0
+    cur_thr = threshold if scalar else threshold[1:]
+    prev_thr = threshold if scalar else threshold[:-1]
+
+    # Both comparisons are kept: "not above" is not "<= threshold" for NaN
+    # (e.g. RSI warm-up), so a single above-mask XOR would misfire there.
+    # Writing into out directly saves the temporaries of the & expression.
+    out[0] = False
+    np.greater(values[1:], cur_thr, out=out[1:])
+    out[1:] &= values[:-1] <= prev_thr
+    return out
+
+
 def crossed_above(series: pd.Series, threshold) -> pd.Series:
     """
     Detect when a series crosses above a threshold value or another series.
@@ -102,12 +268,14 @@ def crossed_above(series: pd.Series, threshold) -> pd.Series:
     Args:
         series: The indicator series to check.
         threshold: A scalar value or another Series to compare against.
+            A Series threshold is compared positionally, so it must share
+            the index of `series` (true for columns of one DataFrame).
 
     Returns:
         Boolean Series — True on the candle where the crossover occurs.
     """
-    if isinstance(threshold, (int, float, np.integer, np.floating)):
-        return (series > threshold) & (series.shift(1) <= threshold)
-    else:
-        # Series vs Series comparison
-        return (series > threshold) & (series.shift(1) <= threshold.shift(1))
+    if np.ndim(threshold) != 0:
+        threshold = _as_array(threshold)
+    return pd.Series(
+        _crossed_above_np(_as_array(series), threshold), index=series.index, copy=False
+    )
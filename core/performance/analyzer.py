@@ -12,7 +12,19 @@ No Freqtrade imports permitted in this file.
 import sqlite3
 from typing import Optional
 
-from core.performance.database import get_connection
+import numpy as np
+
+from core.performance.database import get_connection, release_connection
+
+
+# Aggregates consumed by PerformanceAnalyzer._summary_from_totals, in order.
+_SUMMARY_AGGREGATES = """
+    COUNT(*),
+    COUNT(CASE WHEN pnl_percent > 0 THEN 1 END),
+    SUM(CASE WHEN pnl_percent > 0 THEN pnl_percent END),
+    SUM(CASE WHEN pnl_percent <= 0 THEN pnl_percent END),
+    AVG(duration_minutes)
+"""
 
 
 class PerformanceAnalyzer:
@@ -24,17 +36,31 @@ class PerformanceAnalyzer:
         print(analyzer.summary())
         print(analyzer.by_regime())
         print(analyzer.detect_decay("momentum_rsi_bb"))
+        pnls = analyzer.to_numpy("momentum_rsi_bb")["pnl_percent"]
     """
 
     def __init__(self, db_path: str = None):
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        self._columns: Optional[dict[str, np.ndarray]] = None
+        self._columns_version: Optional[tuple[int, int]] = None
 
     def _get_conn(self) -> sqlite3.Connection:
         if self._conn is None:
             self._conn = get_connection(self._db_path)
         return self._conn
 
+    def _query(self, sql: str, params=()) -> sqlite3.Cursor:
+        """
+        Execute on a cursor yielding plain tuples.
+
+        Aggregation paths read columns by position, so they skip the
+        connection's sqlite3.Row factory; recent_trades keeps Row for dicts.
+        """
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+
     def summary(
         self,
         strategy: str = None,
@@ -51,8 +77,6 @@ class PerformanceAnalyzer:
             Dict with: total_trades, wins, losses, win_rate, avg_win_pct,
             avg_loss_pct, expectancy_pct, profit_factor, avg_duration_min
         """
-        conn = self._get_conn()
-
         where_clauses = ["exit_time IS NOT NULL"]
         params = []
 
@@ -65,59 +89,12 @@ class PerformanceAnalyzer:
 
         where = " AND ".join(where_clauses)
 
-        rows = conn.execute(
-            f"SELECT pnl_percent, duration_minutes FROM trade_log WHERE {where}",
+        row = self._query(
+            f"SELECT {_SUMMARY_AGGREGATES} FROM trade_log WHERE {where}",
             params,
-        ).fetchall()
-
-        if not rows:
-            return {
-                "total_trades": 0,
-                "wins": 0,
-                "losses": 0,
-                "win_rate": 0.0,
-                "avg_win_pct": 0.0,
-                "avg_loss_pct": 0.0,
-                "expectancy_pct": 0.0,
-                "profit_factor": 0.0,
-                "avg_duration_min": 0.0,
-            }
-
-        pnls = [r["pnl_percent"] for r in rows]
-        durations = [r["duration_minutes"] for r in rows if r["duration_minutes"] is not None]
-
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p <= 0]
-
-        total = len(pnls)
-        win_count = len(wins)
-        loss_count = len(losses)
-        win_rate = win_count / total if total > 0 else 0.0
+        ).fetchone()
 
-        avg_win = sum(wins) / len(wins) if wins else 0.0
-        avg_loss = sum(losses) / len(losses) if losses else 0.0
-
-        # Expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
-        expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
-
-        # Profit factor = gross_wins / abs(gross_losses)
-        gross_wins = sum(wins)
-        gross_losses = abs(sum(losses))
-        profit_factor = gross_wins / gross_losses if gross_losses > 0 else float("inf") if gross_wins > 0 else 0.0
-
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
-
-        return {
-            "total_trades": total,
-            "wins": win_count,
-            "losses": loss_count,
-            "win_rate": round(win_rate, 4),
-            "avg_win_pct": round(avg_win, 4),
-            "avg_loss_pct": round(avg_loss, 4),
-            "expectancy_pct": round(expectancy, 4),
-            "profit_factor": round(profit_factor, 4),
-            "avg_duration_min": round(avg_duration, 2),
-        }
+        return self._summary_from_totals(*row)
 
     def by_regime(self, strategy: str = None) -> dict:
         """
@@ -129,8 +106,6 @@ class PerformanceAnalyzer:
         Returns:
             Dict keyed by regime label, each containing a summary dict.
         """
-        conn = self._get_conn()
-
         where_clauses = ["exit_time IS NOT NULL", "entry_regime IS NOT NULL"]
         params = []
 
@@ -140,17 +115,16 @@ class PerformanceAnalyzer:
 
         where = " AND ".join(where_clauses)
 
-        regimes = conn.execute(
-            f"SELECT DISTINCT entry_regime FROM trade_log WHERE {where}",
+        rows = self._query(
+            f"""
+            SELECT entry_regime, {_SUMMARY_AGGREGATES}
+            FROM trade_log WHERE {where}
+            GROUP BY entry_regime
+            """,
             params,
         ).fetchall()
 
-        result = {}
-        for row in regimes:
-            regime_name = row["entry_regime"]
-            result[regime_name] = self.summary(strategy=strategy, regime=regime_name)
-
-        return result
+        return {row[0]: self._summary_from_totals(*row[1:]) for row in rows}
 
     def detect_decay(
         self,
@@ -174,35 +148,41 @@ class PerformanceAnalyzer:
             Dict with: has_enough_data, recent (summary), baseline (summary),
             win_rate_delta, expectancy_delta, decay_detected, recommendation
         """
-        conn = self._get_conn()
-
-        rows = conn.execute(
-            """
-            SELECT pnl_percent, duration_minutes, entry_regime
-            FROM trade_log
-            WHERE strategy = ? AND exit_time IS NOT NULL
-            ORDER BY exit_time DESC
-            """,
+        total_closed = self._query(
+            "SELECT COUNT(*) FROM trade_log WHERE strategy = ? AND exit_time IS NOT NULL",
             (strategy,),
-        ).fetchall()
+        ).fetchone()[0]
 
         total_needed = recent_window + baseline_window
 
-        if len(rows) < recent_window:
+        if total_closed < recent_window:
             return {
                 "has_enough_data": False,
-                "total_closed_trades": len(rows),
+                "total_closed_trades": total_closed,
                 "needed": total_needed,
                 "recommendation": f"Need at least {recent_window} closed trades for analysis.",
             }
 
-        recent_pnls = [r["pnl_percent"] for r in rows[:recent_window]]
-        baseline_pnls = [r["pnl_percent"] for r in rows[recent_window:recent_window + baseline_window]]
+        # Only the recent + baseline windows cross into Python, however long
+        # the strategy's history is.
+        rows = self._query(
+            """
+            SELECT pnl_percent
+            FROM trade_log
+            WHERE strategy = ? AND exit_time IS NOT NULL
+            ORDER BY exit_time DESC
+            LIMIT ?
+            """,
+            (strategy, total_needed),
+        ).fetchall()
+
+        recent_pnls = [r[0] for r in rows[:recent_window]]
+        baseline_pnls = [r[0] for r in rows[recent_window:]]
 
         if not baseline_pnls:
             return {
                 "has_enough_data": False,
-                "total_closed_trades": len(rows),
+                "total_closed_trades": total_closed,
                 "needed": total_needed,
                 "recommendation": f"Need at least {total_needed} closed trades for decay comparison.",
             }
@@ -237,7 +217,7 @@ class PerformanceAnalyzer:
 
         return {
             "has_enough_data": True,
-            "total_closed_trades": len(rows),
+            "total_closed_trades": total_closed,
             "recent": recent_summary,
             "baseline": baseline_summary,
             "win_rate_delta": round(wr_delta, 4),
@@ -276,16 +256,135 @@ class PerformanceAnalyzer:
 
         return [dict(r) for r in rows]
 
+    def to_numpy(self, strategy: str = None) -> dict[str, np.ndarray]:
+        """
+        Closed trades as column arrays, for bulk analytics.
+
+        The columns are loaded from SQLite once and cached until the
+        database changes, so repeated scans run over contiguous arrays
+        rather than re-fetching rows. Unfiltered results are the cached
+        arrays themselves and are read-only; copy before modifying.
+
+        Args:
+            strategy: Filter by strategy name (optional).
+
+        Returns:
+            Dict of equal-length arrays: pnl_percent, duration_minutes
+            (float64, NaN where missing), entry_regime, exit_time, strategy
+            (object).
+        """
+        columns = self._load_columns()
+        if not strategy:
+            return dict(columns)
+        mask = columns["strategy"] == strategy
+        return {name: values[mask] for name, values in columns.items()}
+
+    def _load_columns(self) -> dict[str, np.ndarray]:
+        conn = self._get_conn()
+
+        # data_version moves when other connections commit; total_changes
+        # covers writes through this (possibly shared) connection. Neither
+        # moves when a batch() savepoint rolls back, so nothing read while
+        # a transaction is open is cached.
+        in_transaction = conn.in_transaction
+        data_version = self._query("PRAGMA data_version").fetchone()[0]
+        version = (data_version, conn.total_changes)
+        if (
+            not in_transaction
+            and self._columns is not None
+            and self._columns_version == version
+        ):
+            return self._columns
+
+        rows = self._query(
+            """
+            SELECT pnl_percent, duration_minutes, entry_regime, exit_time, strategy
+            FROM trade_log
+            WHERE exit_time IS NOT NULL
+            """
+        ).fetchall()
+        pnl, duration, regime, exit_time, strategy = zip(*rows) if rows else ((),) * 5
+
+        columns = {
+            "pnl_percent": np.array(pnl, dtype=np.float64),
+            "duration_minutes": np.array(duration, dtype=np.float64),
+            "entry_regime": np.array(regime, dtype=object),
+            "exit_time": np.array(exit_time, dtype=object),
+            "strategy": np.array(strategy, dtype=object),
+        }
+        for values in columns.values():
+            values.flags.writeable = False
+
+        if in_transaction:
+            self._columns = None
+        else:
+            self._columns = columns
+            self._columns_version = version
+        return columns
+
     def close(self):
         """Close the database connection."""
         if self._conn:
-            self._conn.close()
+            release_connection(self._conn)
             self._conn = None
+        self._columns = None
+
+    @staticmethod
+    def _summary_from_totals(
+        total: int,
+        win_count: int,
+        gross_win: Optional[float],
+        gross_loss: Optional[float],
+        avg_duration: Optional[float],
+    ) -> dict:
+        """Build the summary() dict from SQL aggregate totals."""
+        if not total:
+            return {
+                "total_trades": 0,
+                "wins": 0,
+                "losses": 0,
+                "win_rate": 0.0,
+                "avg_win_pct": 0.0,
+                "avg_loss_pct": 0.0,
+                "expectancy_pct": 0.0,
+                "profit_factor": 0.0,
+                "avg_duration_min": 0.0,
+            }
+
+        gross_win = gross_win or 0.0
+        gross_loss = gross_loss or 0.0
+        loss_count = total - win_count
+        win_rate = win_count / total
+
+        avg_win = gross_win / win_count if win_count else 0.0
+        avg_loss = gross_loss / loss_count if loss_count else 0.0
+
+        # Expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
+        expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
+
+        # Profit factor = gross_wins / abs(gross_losses)
+        gross_losses = abs(gross_loss)
+        profit_factor = gross_win / gross_losses if gross_losses > 0 else float("inf") if gross_win > 0 else 0.0
+
+        return {
+            "total_trades": total,
+            "wins": win_count,
+            "losses": loss_count,
+            "win_rate": round(win_rate, 4),
+            "avg_win_pct": round(avg_win, 4),
+            "avg_loss_pct": round(avg_loss, 4),
+            "expectancy_pct": round(expectancy, 4),
+            "profit_factor": round(profit_factor, 4),
+            "avg_duration_min": round(avg_duration or 0.0, 2),
+        }
 
     @staticmethod
     def _compute_summary(pnls: list[float]) -> dict:
         """Compute summary metrics from a list of P&L percentages."""
-        if not pnls:
+        arr = np.asarray(pnls, dtype=np.float64)
+        total = arr.size
+
+        if not total:
             return {
                 "total_trades": 0,
                 "win_rate": 0.0,
@@ -295,18 +394,20 @@ class PerformanceAnalyzer:
                 "profit_factor": 0.0,
             }
 
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p <= 0]
+        win_mask = arr > 0
+        win_count = int(np.count_nonzero(win_mask))
+        loss_count = total - win_count
+
+        gross_win = float(arr[win_mask].sum())
+        gross_loss = float(arr[~win_mask].sum())
 
-        total = len(pnls)
-        win_rate = len(wins) / total if total else 0.0
-        avg_win = sum(wins) / len(wins) if wins else 0.0
-        avg_loss = sum(losses) / len(losses) if losses else 0.0
+        win_rate = win_count / total
+        avg_win = gross_win / win_count if win_count else 0.0
+        avg_loss = gross_loss / loss_count if loss_count else 0.0
         expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
 
-        gross_wins = sum(wins)
-        gross_losses = abs(sum(losses))
-        profit_factor = gross_wins / gross_losses if gross_losses > 0 else float("inf") if gross_wins > 0 else 0.0
+        gross_losses = abs(gross_loss)
+        profit_factor = gross_win / gross_losses if gross_losses > 0 else float("inf") if gross_win > 0 else 0.0
 
         return {
             "total_trades": total,
@@ -9,19 +9,39 @@ No Freqtrade imports permitted in this file.
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 
 DEFAULT_DB_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 DEFAULT_DB_PATH = DEFAULT_DB_DIR / "performance.db"
 
+# Shared connections keyed by (resolved path, thread id). sqlite3 connections
+# are bound to their creating thread, so sharing is per thread.
+_CONN_CACHE: dict[tuple[str, int], sqlite3.Connection] = {}
+_CONN_REFS: dict[tuple[str, int], int] = {}
+# Paths whose schema has been ensured. On-disk databases stay listed for the
+# life of the process; in-memory ones only while a connection keeps them.
+_INITED: set[str] = set()
+_LOCK = threading.Lock()
+# Open savepoint() depth per shared connection. Only touched by the thread
+# that owns the connection, so it needs no lock.
+_BATCH_DEPTH: dict[sqlite3.Connection, int] = {}
+
 
 def get_connection(db_path: str = None) -> sqlite3.Connection:
     """
-    Get a SQLite connection, creating the database and tables if needed.
+    Get the shared SQLite connection for a database, creating it if needed.
+
+    Connections are cached per resolved path (and thread), and the schema
+    is only ensured the first time a path is opened. Every call must be
+    paired with release_connection().
 
     Args:
-        db_path: Path to database file. Defaults to ATS_ROOT/data/performance.db
+        db_path: Path to database file, or a "file:" URI (e.g.
+            "file:name?mode=memory&cache=shared"), which is opened as-is.
+            Defaults to ATS_ROOT/data/performance.db
 
     Returns:
         sqlite3.Connection with row_factory set to sqlite3.Row
@@ -29,79 +49,217 @@ def get_connection(db_path: str = None) -> sqlite3.Connection:
     if db_path is None:
         db_path = str(DEFAULT_DB_PATH)
 
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    is_uri = db_path.startswith("file:")
+    path = db_path if is_uri else os.path.abspath(db_path)
+    key = (path, threading.get_ident())
+
+    with _LOCK:
+        conn = _CONN_CACHE.get(key)
+        if conn is None:
+            if not is_uri:
+                # Ensure directory exists
+                os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent read performance
-    _ensure_tables(conn)
+            conn = sqlite3.connect(path, uri=is_uri)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent read performance
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fewer fsyncs
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            if path not in _INITED:
+                _ensure_tables(conn)
+                _INITED.add(path)
+            _CONN_CACHE[key] = conn
+            _CONN_REFS[key] = 0
+        _CONN_REFS[key] += 1
     return conn
 
 
+def _is_memory(path: str) -> bool:
+    """True for in-memory database URIs, which vanish with their last connection."""
+    return path.startswith("file:") and (
+        "mode=memory" in path or path.startswith("file::memory:")
+    )
+
+
+def release_connection(conn: sqlite3.Connection) -> None:
+    """
+    Release a connection obtained from get_connection().
+
+    The underlying connection is closed once its last user releases it.
+    """
+    with _LOCK:
+        for key, cached in _CONN_CACHE.items():
+            if cached is conn:
+                break
+        else:
+            conn.close()
+            return
+
+        _CONN_REFS[key] -= 1
+        if _CONN_REFS[key] > 0:
+            return
+
+        del _CONN_CACHE[key]
+        del _CONN_REFS[key]
+        if _is_memory(key[0]) and not any(k[0] == key[0] for k in _CONN_CACHE):
+            _INITED.discard(key[0])  # Gone with its last connection
+    _BATCH_DEPTH.pop(conn, None)
+    conn.close()
+
+
+def close_all() -> None:
+    """Close every cached connection (for shutdown)."""
+    with _LOCK:
+        conns = list(_CONN_CACHE.values())
+        _CONN_CACHE.clear()
+        _CONN_REFS.clear()
+        _INITED.clear()
+    for conn in conns:
+        _BATCH_DEPTH.pop(conn, None)
+        conn.close()
+
+
+@contextmanager
+def savepoint(conn: sqlite3.Connection):
+    """
+    Group writes on a shared connection into one atomic, nestable block.
+
+    Each block is a SAVEPOINT, so a block that raises rolls back only its
+    own writes, leaving enclosing blocks intact. While any block is open
+    on the connection, commit_unless_batched() defers for every user of
+    it; the outermost block commits on exit.
+
+    Writes from other users of the same connection made while a block is
+    open (same thread, so necessarily from inside the block) belong to
+    that block, and readers on the connection see them before commit.
+    """
+    depth = _BATCH_DEPTH.get(conn, 0)
+    name = f"ats_batch_{depth}"
+    conn.execute(f"SAVEPOINT {name}")
+    _BATCH_DEPTH[conn] = depth + 1
+    try:
+        yield conn
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    else:
+        conn.execute(f"RELEASE {name}")
+    finally:
+        if depth:
+            _BATCH_DEPTH[conn] = depth
+        else:
+            del _BATCH_DEPTH[conn]
+    if not depth:
+        conn.commit()  # In case the block joined an already open transaction
+
+
+def commit_unless_batched(conn: sqlite3.Connection) -> None:
+    """Commit, unless a savepoint() block is open on this connection."""
+    if not _BATCH_DEPTH.get(conn):
+        conn.commit()
+
+
+# Schema DDL, executed statement by statement the first time a path is opened.
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS trade_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trade_id TEXT NOT NULL,
+        pair TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+
+        -- Entry context
+        entry_time TEXT NOT NULL,
+        entry_price REAL NOT NULL,
+        entry_rsi REAL,
+        entry_tema REAL,
+        entry_bb_percent REAL,
+        entry_bb_width REAL,
+        entry_adx REAL,
+        entry_volatility_regime TEXT,
+        entry_trend_regime TEXT,
+        entry_regime TEXT,
+
+        -- Exit context (NULL until trade closes)
+        exit_time TEXT,
+        exit_price REAL,
+        exit_reason TEXT,
+        exit_rsi REAL,
+        exit_tema REAL,
+        exit_bb_percent REAL,
+        exit_bb_width REAL,
+        exit_adx REAL,
+        exit_volatility_regime TEXT,
+        exit_trend_regime TEXT,
+        exit_regime TEXT,
+
+        -- Performance
+        pnl_absolute REAL,
+        pnl_percent REAL,
+        duration_minutes REAL,
+        regime_changed INTEGER,
+
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS regime_snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        pair TEXT NOT NULL,
+        volatility_regime TEXT,
+        trend_regime TEXT,
+        regime TEXT,
+        bb_width REAL,
+        adx REAL,
+        rsi REAL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_strategy
+        ON trade_log(strategy)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_strategy_exit
+        ON trade_log(strategy, exit_time) WHERE exit_time IS NOT NULL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_regime_exit
+        ON trade_log(entry_regime, exit_time) WHERE exit_time IS NOT NULL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_open
+        ON trade_log(pair, entry_time DESC) WHERE exit_time IS NULL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_regime
+        ON trade_log(entry_regime)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trade_log_pair
+        ON trade_log(pair)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_regime_snapshots_pair
+        ON regime_snapshots(pair, timestamp)
+    """,
+]
+
+
 def _ensure_tables(conn: sqlite3.Connection) -> None:
-    """Create tables if they don't exist."""
-    conn.executescript("""
-        CREATE TABLE IF NOT EXISTS trade_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            trade_id TEXT NOT NULL,
-            pair TEXT NOT NULL,
-            strategy TEXT NOT NULL,
-
-            -- Entry context
-            entry_time TEXT NOT NULL,
-            entry_price REAL NOT NULL,
-            entry_rsi REAL,
-            entry_tema REAL,
-            entry_bb_percent REAL,
-            entry_bb_width REAL,
-            entry_adx REAL,
-            entry_volatility_regime TEXT,
-            entry_trend_regime TEXT,
-            entry_regime TEXT,
-
-            -- Exit context (NULL until trade closes)
-            exit_time TEXT,
-            exit_price REAL,
-            exit_reason TEXT,
-            exit_rsi REAL,
-            exit_tema REAL,
-            exit_bb_percent REAL,
-            exit_bb_width REAL,
-            exit_adx REAL,
-            exit_volatility_regime TEXT,
-            exit_trend_regime TEXT,
-            exit_regime TEXT,
-
-            -- Performance
-            pnl_absolute REAL,
-            pnl_percent REAL,
-            duration_minutes REAL,
-            regime_changed INTEGER,
-
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS regime_snapshots (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            pair TEXT NOT NULL,
-            volatility_regime TEXT,
-            trend_regime TEXT,
-            regime TEXT,
-            bb_width REAL,
-            adx REAL,
-            rsi REAL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_trade_log_strategy
-            ON trade_log(strategy);
-        CREATE INDEX IF NOT EXISTS idx_trade_log_regime
-            ON trade_log(entry_regime);
-        CREATE INDEX IF NOT EXISTS idx_trade_log_pair
-            ON trade_log(pair);
-        CREATE INDEX IF NOT EXISTS idx_regime_snapshots_pair
-            ON regime_snapshots(pair, timestamp);
-    """)
+    """Create tables and indexes if they don't exist, then refresh planner stats."""
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    # Populate sqlite_stat1 so the planner picks the composite indexes, but
+    # only once per database: a full ANALYZE rescans the whole table.
+    has_stats = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone() and conn.execute(
+        "SELECT 1 FROM sqlite_stat1 WHERE tbl = 'trade_log' LIMIT 1"
+    ).fetchone()
+    if not has_stats:
+        conn.execute("ANALYZE trade_log")
     conn.commit()
@@ -8,13 +8,35 @@ performance by market condition.
 No Freqtrade imports permitted in this file.
 """
 
+import bisect
+import math
+import sys
+
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence
+
+
+_VOLATILITY_LABELS = ("low", "medium", "high", "unknown")
+_TREND_LABELS = ("ranging", "weak_trend", "strong_trend", "unknown")
+
+# ADX cut points; the number of cuts at or below a value indexes _TREND_LABELS.
+_TREND_WEAK = 20.0
+_TREND_STRONG = 30.0
+_TREND_CUTS = np.array([_TREND_WEAK, _TREND_STRONG])
+_TREND_LABEL_ARRAY = np.array(_TREND_LABELS)
+
+# Every volatility/trend combination, built once so classify_regime hands out
+# the same interned string for a given regime instead of formatting per bar.
+_COMBINED = {
+    (vol, trend): sys.intern(f"{vol}_{trend}")
+    for vol in _VOLATILITY_LABELS
+    for trend in _TREND_LABELS
+}
 
 
 def classify_volatility(
     bb_width: float,
-    bb_width_history: list[float],
+    bb_width_history: Sequence[float] | np.ndarray,
     low_percentile: float = 25.0,
     high_percentile: float = 75.0,
 ) -> str:
@@ -25,17 +47,21 @@ def classify_volatility(
         bb_width: Current Bollinger Band width value.
         bb_width_history: Recent BB width values for percentile calculation.
             Should contain at least 20 values for meaningful percentiles.
+            A float64 ndarray (e.g. a slice of a preallocated ring buffer)
+            is used as-is, without the list-to-array copy.
         low_percentile: Percentile below which volatility is "low" (default 25).
         high_percentile: Percentile above which volatility is "high" (default 75).
 
     Returns:
         "low", "medium", or "high"
     """
-    if not bb_width_history or len(bb_width_history) < 2:
+    if bb_width_history is None or len(bb_width_history) < 2:
         return "unknown"
 
-    low_threshold = float(np.percentile(bb_width_history, low_percentile))
-    high_threshold = float(np.percentile(bb_width_history, high_percentile))
+    # One selection pass for both thresholds
+    low_threshold, high_threshold = np.percentile(
+        bb_width_history, [low_percentile, high_percentile]
+    )
 
     if bb_width < low_threshold:
         return "low"
@@ -45,6 +71,195 @@ def classify_volatility(
         return "medium"
 
 
+class PSquareQuantile:
+    """
+    Streaming quantile estimator (P-square algorithm, Jain & Chlamtac 1985).
+
+    Tracks one quantile with five markers, so each update is O(1) time and
+    memory regardless of how many values have been seen. Until five values
+    have arrived the estimate is the exact percentile of those values.
+
+    Usage:
+        q75 = PSquareQuantile(0.75)
+        for x in stream:
+            q75.update(x)
+        q75.quantile()
+    """
+
+    def __init__(self, p: float):
+        """
+        Args:
+            p: Quantile to track, in (0, 1) (e.g. 0.25 for the 25th percentile).
+        """
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"Quantile must be in (0, 1), got {p}")
+        self.p = p
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        q = self._heights
+
+        if self.count <= 5:
+            bisect.insort(q, x)
+            return
+
+        n = self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(q, x, 1, 4) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Nudge the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def quantile(self) -> float:
+        """Current quantile estimate (NaN before any observation)."""
+        if self.count == 0:
+            return float("nan")
+        if self.count < 5:
+            return float(np.percentile(self._heights, self.p * 100))
+        return self._heights[2]
+
+
+def _sorted_percentile(values: list[float], pct: float) -> float:
+    """np.percentile (linear method) of an already sorted list, in O(1)."""
+    pos = (len(values) - 1) * (pct / 100.0)  # NumPy's rounding order
+    lo = int(pos)
+    if lo + 1 >= len(values):
+        return float(values[-1])
+    a, b = values[lo], values[lo + 1]
+    t = pos - lo
+    # Same two-sided lerp as NumPy, so thresholds match bit for bit
+    return float(a + (b - a) * t if t < 0.5 else b - (b - a) * (1 - t))
+
+
+class VolatilityRegimeState:
+    """
+    Stateful volatility classifier for one pair, fed one BB width per bar.
+
+    classify_volatility() re-computes percentiles over the full history on
+    every call. This keeps P-square estimates of the low/high percentiles
+    instead, so each bar is O(1). During the first `warmup` values the
+    thresholds are exact percentiles of the values seen so far, identical
+    to classify_volatility().
+
+    With exact=True the full history is kept in a sorted list instead
+    (bisect.insort, an O(N) memmove per bar that is cheap in practice, and
+    O(1) percentile lookups), at the cost of O(N) memory. Labels then
+    match classify_volatility() over the same NaN-free history. NaN widths
+    (e.g. during BB warm-up) are skipped here, whereas np.percentile over
+    a history containing NaN yields NaN thresholds and classify_volatility()
+    returns "medium", so the two differ while NaNs are in the history.
+
+    Usage:
+        state = VolatilityRegimeState()
+        for bb_width in widths:
+            label = state.update(bb_width)
+    """
+
+    def __init__(
+        self,
+        low_percentile: float = 25.0,
+        high_percentile: float = 75.0,
+        warmup: int = 20,
+        exact: bool = False,
+    ):
+        self.low_percentile = low_percentile
+        self.high_percentile = high_percentile
+        self.warmup = warmup
+        self.exact = exact
+        self.count = 0
+        self._low = PSquareQuantile(low_percentile / 100.0)
+        self._high = PSquareQuantile(high_percentile / 100.0)
+        self._warmup_values: list[float] = []
+        self._sorted: list[float] = []
+
+    def thresholds(self) -> tuple[float, float]:
+        """Current (low, high) BB width thresholds."""
+        if self.exact:
+            return (
+                _sorted_percentile(self._sorted, self.low_percentile),
+                _sorted_percentile(self._sorted, self.high_percentile),
+            )
+        if self.count < self.warmup:
+            low, high = np.percentile(
+                self._warmup_values, [self.low_percentile, self.high_percentile]
+            )
+            return float(low), float(high)
+        return self._low.quantile(), self._high.quantile()
+
+    def classify(self, bb_width: float) -> str:
+        """
+        Classify bb_width against the history seen so far (without adding it).
+
+        Returns:
+            "low", "medium", "high", or "unknown" (fewer than 2 values seen)
+        """
+        if self.count < 2:
+            return "unknown"
+
+        low_threshold, high_threshold = self.thresholds()
+
+        if bb_width < low_threshold:
+            return "low"
+        elif bb_width > high_threshold:
+            return "high"
+        else:
+            return "medium"
+
+    def add(self, bb_width: float) -> None:
+        """Add a BB width to the history. NaN values are ignored."""
+        if bb_width is None or np.isnan(bb_width):
+            return
+        self.count += 1
+        if self.exact:
+            bisect.insort(self._sorted, bb_width)
+            return
+        self._low.update(bb_width)
+        self._high.update(bb_width)
+        if self.count < self.warmup:
+            self._warmup_values.append(bb_width)
+        elif self._warmup_values:
+            self._warmup_values = []
+
+    def update(self, bb_width: float) -> str:
+        """Classify bb_width against prior history, then add it."""
+        label = self.classify(bb_width)
+        self.add(bb_width)
+        return label
+
+
 def classify_trend(adx: float) -> str:
     """
     Classify trend regime based on ADX value.
@@ -60,20 +275,42 @@ def classify_trend(adx: float) -> str:
     Returns:
         "ranging", "weak_trend", or "strong_trend"
     """
-    if adx is None or np.isnan(adx):
+    if adx is None:
+        return "unknown"
+    adx = float(adx)  # bool sums below must be ints, not numpy bool ORs
+    if math.isnan(adx):
         return "unknown"
 
-    if adx < 20:
-        return "ranging"
-    elif adx < 30:
-        return "weak_trend"
-    else:
-        return "strong_trend"
+    # Branchless: count the cut points passed
+    return _TREND_LABELS[(adx >= _TREND_WEAK) + (adx >= _TREND_STRONG)]
+
+
+def classify_trend_bulk(adx) -> np.ndarray:
+    """
+    Vectorized classify_trend over a whole ADX array or Series.
+
+    Uses one binary search over the cut points per value instead of
+    per-bar Python branches, for labelling historical dataframes.
+
+    Args:
+        adx: Array-like or scalar ADX values (NaN allowed).
+
+    Returns:
+        String array (0-d for scalar input) of "ranging", "weak_trend",
+        "strong_trend", or "unknown"
+    """
+    adx = np.asarray(adx, dtype=np.float64)
+    idx = np.where(
+        np.isnan(adx),
+        len(_TREND_LABELS) - 1,  # "unknown"
+        np.searchsorted(_TREND_CUTS, adx, side="right"),
+    )
+    return _TREND_LABEL_ARRAY[idx]
 
 
 def classify_regime(
     bb_width: float,
-    bb_width_history: list[float],
+    bb_width_history: Sequence[float] | np.ndarray,
     adx: float,
 ) -> dict:
     """
@@ -91,7 +328,7 @@ def classify_regime(
     """
     vol = classify_volatility(bb_width, bb_width_history)
     trend = classify_trend(adx)
-    combined = f"{vol}_{trend}"
+    combined = _COMBINED[(vol, trend)]
 
     return {
         "volatility": vol,
@@ -8,10 +8,63 @@ No Freqtrade imports permitted in this file.
 """
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
-from core.performance.database import get_connection
+from core.performance.database import (
+    commit_unless_batched,
+    get_connection,
+    release_connection,
+    savepoint,
+)
+
+
+_MISSING = object()
+
+_INSERT_ENTRY_SQL = """
+    INSERT INTO trade_log (
+        trade_id, pair, strategy,
+        entry_time, entry_price,
+        entry_rsi, entry_tema, entry_bb_percent, entry_bb_width, entry_adx,
+        entry_volatility_regime, entry_trend_regime, entry_regime
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TRADE_SQL = """
+    INSERT INTO trade_log (
+        trade_id, pair, strategy,
+        entry_time, entry_price,
+        entry_rsi, entry_tema, entry_bb_percent, entry_bb_width, entry_adx,
+        entry_volatility_regime, entry_trend_regime, entry_regime,
+        exit_time, exit_price, exit_reason,
+        exit_rsi, exit_tema, exit_bb_percent, exit_bb_width, exit_adx,
+        exit_volatility_regime, exit_trend_regime, exit_regime,
+        duration_minutes,
+        pnl_absolute, pnl_percent, regime_changed
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+_SELECT_ENTRY_REGIME_SQL = (
+    "SELECT entry_regime FROM trade_log WHERE trade_id = ? ORDER BY id DESC LIMIT 1"
+)
+
+# Served by the idx_trade_log_open partial index (open trades only)
+_FIND_OPEN_TRADE_SQL = """
+    SELECT trade_id FROM trade_log
+    WHERE pair = ? AND exit_time IS NULL
+    ORDER BY entry_time DESC LIMIT 1
+"""
+
+_INSERT_SNAPSHOT_SQL = """
+    INSERT INTO regime_snapshots (
+        timestamp, pair, volatility_regime, trend_regime, regime,
+        bb_width, adx, rsi
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class TradeLogger:
@@ -22,6 +75,10 @@ class TradeLogger:
         logger = TradeLogger()  # Uses default DB path
         logger.log_entry(trade_id="1", pair="BTC/USDT", ...)
         logger.log_exit(trade_id="1", ...)
+
+        with logger.batch():  # One commit for many events
+            for ...:
+                logger.log_regime_snapshot(...)
     """
 
     def __init__(self, db_path: str = None):
@@ -32,12 +89,29 @@ class TradeLogger:
         """
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        # trade_id -> entry_regime for entries logged through this instance,
+        # so log_exit can skip the lookup query.
+        self._open_regimes: dict[str, Optional[str]] = {}
 
     def _get_conn(self) -> sqlite3.Connection:
         if self._conn is None:
             self._conn = get_connection(self._db_path)
         return self._conn
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer commits from log_* calls until the block exits.
+
+        Collapses one commit (and fsync) per event into one per block.
+        A block that raises rolls back only its own writes. Loggers and
+        analyzers on the same path and thread share one connection, so
+        their commits are deferred too while any block is open; the
+        outermost block commits on exit.
+        """
+        with savepoint(self._get_conn()):
+            yield self
+
     def log_entry(
         self,
         trade_id: str,
@@ -65,14 +139,7 @@ class TradeLogger:
         """
         conn = self._get_conn()
         cursor = conn.execute(
-            """
-            INSERT INTO trade_log (
-                trade_id, pair, strategy,
-                entry_time, entry_price,
-                entry_rsi, entry_tema, entry_bb_percent, entry_bb_width, entry_adx,
-                entry_volatility_regime, entry_trend_regime, entry_regime
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_ENTRY_SQL,
             (
                 str(trade_id),
                 pair,
@@ -89,9 +156,61 @@ class TradeLogger:
                 regime.get("combined"),
             ),
         )
-        conn.commit()
+        commit_unless_batched(conn)
+        self._open_regimes[str(trade_id)] = regime.get("combined")
         return cursor.lastrowid
 
+    def log_entries_bulk(self, rows: Iterable[tuple]) -> int:
+        """
+        Log many trade entries with a single executemany and commit.
+
+        Args:
+            rows: Tuples in trade_log entry column order: trade_id, pair,
+                strategy, entry_time, entry_price, entry_rsi, entry_tema,
+                entry_bb_percent, entry_bb_width, entry_adx,
+                entry_volatility_regime, entry_trend_regime, entry_regime.
+
+        Returns:
+            Number of rows inserted.
+        """
+        rows = list(rows)
+        conn = self._get_conn()
+        cursor = conn.executemany(_INSERT_ENTRY_SQL, rows)
+        commit_unless_batched(conn)
+        for row in rows:
+            self._open_regimes[str(row[0])] = row[12]
+        return cursor.rowcount
+
+    def log_trades_bulk(self, rows: Iterable[tuple]) -> int:
+        """
+        Log many completed trades (entry and exit) with one executemany.
+
+        P&L and regime_changed are derived per row exactly as log_exit
+        does, so the stored rows match an entry/exit pair per trade.
+
+        Args:
+            rows: Tuples of the 13 log_entries_bulk entry columns followed
+                by exit_time, exit_price, exit_reason, exit_rsi, exit_tema,
+                exit_bb_percent, exit_bb_width, exit_adx,
+                exit_volatility_regime, exit_trend_regime, exit_regime,
+                duration_minutes.
+
+        Returns:
+            Number of rows inserted.
+        """
+
+        def with_metrics(row: tuple) -> tuple:
+            entry_price, exit_price = row[4], row[14]
+            pnl_absolute = exit_price - entry_price
+            pnl_percent = (pnl_absolute / entry_price) * 100 if entry_price else 0
+            regime_changed = 1 if row[12] != row[23] else 0
+            return (*row, pnl_absolute, pnl_percent, regime_changed)
+
+        conn = self._get_conn()
+        cursor = conn.executemany(_INSERT_TRADE_SQL, map(with_metrics, rows))
+        commit_unless_batched(conn)
+        return cursor.rowcount
+
     def log_exit(
         self,
         trade_id: str,
@@ -126,17 +245,18 @@ class TradeLogger:
         pnl_percent = (pnl_absolute / entry_price) * 100 if entry_price else 0
 
         # Check if regime changed
-        cursor = conn.execute(
-            "SELECT entry_regime FROM trade_log WHERE trade_id = ? ORDER BY id DESC LIMIT 1",
-            (str(trade_id),),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return False
+        key = str(trade_id)
+        entry_regime = self._open_regimes.pop(key, _MISSING)
+        cached = entry_regime is not _MISSING
+        if not cached:
+            row = conn.execute(_SELECT_ENTRY_REGIME_SQL, (key,)).fetchone()
+            if row is None:
+                return False
+            entry_regime = row[0]
 
-        regime_changed = 1 if row["entry_regime"] != regime.get("combined") else 0
+        regime_changed = 1 if entry_regime != regime.get("combined") else 0
 
-        conn.execute(
+        cursor = conn.execute(
             """
             UPDATE trade_log SET
                 exit_time = ?,
@@ -172,10 +292,14 @@ class TradeLogger:
                 pnl_percent,
                 duration_minutes,
                 regime_changed,
-                str(trade_id),
+                key,
             ),
         )
-        conn.commit()
+        commit_unless_batched(conn)
+
+        # A cached entry may since have been rolled back or deleted
+        if cached and cursor.rowcount == 0:
+            return conn.execute(_SELECT_ENTRY_REGIME_SQL, (key,)).fetchone() is not None
         return True
 
     def log_regime_snapshot(
@@ -196,12 +320,7 @@ class TradeLogger:
         """
         conn = self._get_conn()
         conn.execute(
-            """
-            INSERT INTO regime_snapshots (
-                timestamp, pair, volatility_regime, trend_regime, regime,
-                bb_width, adx, rsi
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_SNAPSHOT_SQL,
             (
                 timestamp,
                 pair,
@@ -213,7 +332,23 @@ class TradeLogger:
                 indicators.get("rsi"),
             ),
         )
-        conn.commit()
+        commit_unless_batched(conn)
+
+    def log_regime_snapshots_bulk(self, rows: Iterable[tuple]) -> int:
+        """
+        Log many regime snapshots with a single executemany and commit.
+
+        Args:
+            rows: Tuples in regime_snapshots column order: timestamp, pair,
+                volatility_regime, trend_regime, regime, bb_width, adx, rsi.
+
+        Returns:
+            Number of rows inserted.
+        """
+        conn = self._get_conn()
+        cursor = conn.executemany(_INSERT_SNAPSHOT_SQL, rows)
+        commit_unless_batched(conn)
+        return cursor.rowcount
 
     def find_open_trade(self, pair: str) -> Optional[str]:
         """
@@ -226,18 +361,11 @@ class TradeLogger:
             trade_id if found, None otherwise.
         """
         conn = self._get_conn()
-        row = conn.execute(
-            """
-            SELECT trade_id FROM trade_log
-            WHERE pair = ? AND exit_time IS NULL
-            ORDER BY entry_time DESC LIMIT 1
-            """,
-            (pair,),
-        ).fetchone()
+        row = conn.execute(_FIND_OPEN_TRADE_SQL, (pair,)).fetchone()
         return row["trade_id"] if row else None
 
     def close(self):
         """Close the database connection."""
         if self._conn:
-            self._conn.close()
+            release_connection(self._conn)
             self._conn = None
@@ -4,11 +4,30 @@ ATS Core — Signal Generation Logic
 Generates entry and exit signals from indicator values.
 This is the trading "brain" — portable across all execution engines.
 
+Uses numba-compiled fused kernels when numba is installed, NumPy otherwise.
+Every entry point hands the kernels contiguous arrays (float64, or float32
+for the check_*_f32 variants); other inputs are converted once up front.
+
 No Freqtrade imports permitted in this file.
 """
 
+from typing import Callable, NamedTuple
+
+import numpy as np
 import pandas as pd
-from core.indicators import crossed_above
+from core.indicators import (
+    _as_array,
+    _bollinger_np,
+    _crossed_above_np,
+    _rsi_np,
+    _tema_np,
+    crossed_above,
+)
+
+try:
+    from core._signals_nb import entry_kernel as _entry_nb, exit_kernel as _exit_nb
+except ImportError:  # numba is optional; fall back to NumPy masks
+    _entry_nb = _exit_nb = None
 
 
 def check_entry_long(
@@ -37,12 +56,16 @@ def check_entry_long(
     Returns:
         Boolean Series — True where entry signal fires.
     """
-    return (
-        crossed_above(rsi, rsi_threshold)
-        & (tema <= bb_middle)
-        & (tema > tema.shift(1))
-        & (volume > 0)
-    )
+    if not _aligned(rsi, tema, bb_middle, volume):
+        # Rare: let pandas align the inputs
+        return (
+            crossed_above(rsi, rsi_threshold)
+            & (tema <= bb_middle)
+            & (tema > tema.shift(1))
+            & (volume > 0)
+        )
+    arrays = make_signal_arrays(rsi, tema, bb_middle, volume)
+    return check_entry_long_arr(arrays, rsi_threshold)
 
 
 def check_exit_long(
@@ -71,9 +94,353 @@ def check_exit_long(
     Returns:
         Boolean Series — True where exit signal fires.
     """
+    if not _aligned(rsi, tema, bb_middle, volume):
+        return (
+            crossed_above(rsi, rsi_threshold)
+            & (tema > bb_middle)
+            & (tema < tema.shift(1))
+            & (volume > 0)
+        )
+    arrays = make_signal_arrays(rsi, tema, bb_middle, volume)
+    return check_exit_long_arr(arrays, rsi_threshold)
+
+
+# ---------------------------------------------------------------------------
+# Shared inputs (entry + exit on the same candles)
+# ---------------------------------------------------------------------------
+
+def _aligned(first: pd.Series, *others: pd.Series) -> bool:
+    """
+    True if all Series share one index, so positional NumPy ops are valid.
+
+    Columns of one DataFrame pass in O(1): their index is either the same
+    object or (pandas 3) a view of it, which equals() short-circuits on.
+    """
+    index = first.index
+    return all(s.index is index or s.index.equals(index) for s in others)
+
+
+class SignalArrays(NamedTuple):
+    """Signal inputs converted once to contiguous float64 arrays."""
+
+    rsi: np.ndarray
+    tema: np.ndarray
+    bb_middle: np.ndarray
+    volume: np.ndarray
+    index: pd.Index
+
+
+def make_signal_arrays(
+    rsi: pd.Series,
+    tema: pd.Series,
+    bb_middle: pd.Series,
+    volume: pd.Series,
+) -> SignalArrays:
+    """
+    Convert signal inputs to arrays once, for both entry and exit checks.
+
+    Adapters that evaluate entry and exit on the same candles should build
+    this once and pass it to check_entry_long_arr and check_exit_long_arr,
+    rather than paying the pandas-to-NumPy conversion in each function.
+    Inputs are taken positionally and must share one index. Columns that
+    are already contiguous float64 (the norm for DataFrame columns) are
+    used without a copy; strided views, e.g. df.iloc[::2], are copied once.
+    """
+    return SignalArrays(
+        _as_array(rsi), _as_array(tema), _as_array(bb_middle), _as_array(volume),
+        rsi.index,
+    )
+
+
+def check_entry_long_arr(arrays: SignalArrays, rsi_threshold: int = 30) -> pd.Series:
+    """check_entry_long on prebuilt SignalArrays."""
+    out = _entry_mask(arrays.rsi, arrays.tema, arrays.bb_middle, arrays.volume, rsi_threshold)
+    return pd.Series(out, index=arrays.index, copy=False)
+
+
+def check_exit_long_arr(arrays: SignalArrays, rsi_threshold: int = 70) -> pd.Series:
+    """check_exit_long on prebuilt SignalArrays."""
+    out = _exit_mask(arrays.rsi, arrays.tema, arrays.bb_middle, arrays.volume, rsi_threshold)
+    return pd.Series(out, index=arrays.index, copy=False)
+
+
+# ---------------------------------------------------------------------------
+# Streaming (latest candle only)
+# ---------------------------------------------------------------------------
+
+def check_entry_long_last(
+    rsi_prev: float,
+    rsi_cur: float,
+    tema_prev: float,
+    tema_cur: float,
+    bb_middle: float,
+    volume: float,
+    rsi_threshold: int = 30,
+) -> bool:
+    """
+    check_entry_long evaluated for the latest candle only.
+
+    For per-candle hooks in live loops: O(1) per call instead of
+    re-evaluating the whole series each time a candle arrives. Use the
+    Series version for warm-up and vectorized backtests.
+
+    Args:
+        rsi_prev: RSI on the previous candle.
+        rsi_cur: RSI on the current candle.
+        tema_prev: TEMA on the previous candle.
+        tema_cur: TEMA on the current candle.
+        bb_middle: Bollinger Band middle band on the current candle.
+        volume: Volume on the current candle.
+        rsi_threshold: RSI level to cross above (default 30).
+
+    Returns:
+        True if the entry signal fires on the current candle.
+    """
+    return bool(
+        rsi_cur > rsi_threshold
+        and rsi_prev <= rsi_threshold
+        and tema_cur <= bb_middle
+        and tema_cur > tema_prev
+        and volume > 0
+    )
+
+
+def check_exit_long_last(
+    rsi_prev: float,
+    rsi_cur: float,
+    tema_prev: float,
+    tema_cur: float,
+    bb_middle: float,
+    volume: float,
+    rsi_threshold: int = 70,
+) -> bool:
+    """
+    check_exit_long evaluated for the latest candle only.
+
+    Same arguments as check_entry_long_last (default rsi_threshold 70).
+
+    Returns:
+        True if the exit signal fires on the current candle.
+    """
+    return bool(
+        rsi_cur > rsi_threshold
+        and rsi_prev <= rsi_threshold
+        and tema_cur > bb_middle
+        and tema_cur < tema_prev
+        and volume > 0
+    )
+
+
+# ---------------------------------------------------------------------------
+# Array pipeline (backtests / parameter sweeps)
+# ---------------------------------------------------------------------------
+
+def _rising(values: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """values[i] > values[i-1] per bar (False on the first), without a shifted copy."""
+    if out is None:
+        out = np.empty(values.shape[0], dtype=bool)
+    if out.shape[0]:
+        out[0] = False
+        np.greater(values[1:], values[:-1], out=out[1:])
+    return out
+
+
+def _falling(values: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """values[i] < values[i-1] per bar (False on the first), without a shifted copy."""
+    if out is None:
+        out = np.empty(values.shape[0], dtype=bool)
+    if out.shape[0]:
+        out[0] = False
+        np.less(values[1:], values[:-1], out=out[1:])
+    return out
+
+
+def _entry_mask_np(
+    r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray, rsi_threshold: float
+) -> np.ndarray:
+    """check_entry_long conditions over aligned float arrays."""
+    out = _crossed_above_np(r, rsi_threshold)
+    # One scratch buffer, AND-ed into out in place, condition by condition
+    scratch = np.empty_like(out)
+    out &= np.less_equal(t, m, out=scratch)
+    out &= _rising(t, out=scratch)
+    out &= np.greater(v, 0, out=scratch)
+    return out
+
+
+def _exit_mask_np(
+    r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray, rsi_threshold: float
+) -> np.ndarray:
+    """check_exit_long conditions over aligned float arrays."""
+    out = _crossed_above_np(r, rsi_threshold)
+    scratch = np.empty_like(out)
+    out &= np.greater(t, m, out=scratch)
+    out &= _falling(t, out=scratch)
+    out &= np.greater(v, 0, out=scratch)
+    return out
+
+
+def _entry_mask(
+    r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray, rsi_threshold: float
+) -> np.ndarray:
+    """Entry mask via the numba kernel when available, else NumPy."""
+    if _entry_nb is None:
+        # A float64 scalar keeps float32 input comparing in float64, as in
+        # the kernel; a Python float would be cast down to float32.
+        return _entry_mask_np(r, t, m, v, np.float64(rsi_threshold))
+    out = np.empty(r.shape[0], dtype=np.bool_)
+    _entry_nb(r, t, m, v, float(rsi_threshold), out)
+    return out
+
+
+def _exit_mask(
+    r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray, rsi_threshold: float
+) -> np.ndarray:
+    """Exit mask via the numba kernel when available, else NumPy."""
+    if _exit_nb is None:
+        return _exit_mask_np(r, t, m, v, np.float64(rsi_threshold))
+    out = np.empty(r.shape[0], dtype=np.bool_)
+    _exit_nb(r, t, m, v, float(rsi_threshold), out)
+    return out
+
+
+def make_entry_checker(rsi_threshold: float = 30) -> Callable[..., np.ndarray]:
+    """
+    Bind check_entry_long's threshold once for repeated array-level calls.
+
+    For loops that evaluate one fixed threshold (from a strategy config)
+    over many bar windows or instruments, e.g. parameter sweeps.
+
+    Args:
+        rsi_threshold: RSI level to cross above (default 30).
+
+    Returns:
+        A function (rsi, tema, bb_middle, volume) -> boolean ndarray over
+        aligned array-likes. Contiguous float64 inputs are used as-is;
+        anything else (strided slices, other dtypes) is copied once so the
+        kernel always runs its contiguous loop.
+    """
+    thr = float(rsi_threshold)
+
+    def check(r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return _entry_mask(_as_array(r), _as_array(t), _as_array(m), _as_array(v), thr)
+
+    return check
+
+
+def make_exit_checker(rsi_threshold: float = 70) -> Callable[..., np.ndarray]:
+    """check_exit_long counterpart of make_entry_checker (default 70)."""
+    thr = float(rsi_threshold)
+
+    def check(r: np.ndarray, t: np.ndarray, m: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return _exit_mask(_as_array(r), _as_array(t), _as_array(m), _as_array(v), thr)
+
+    return check
+
+
+def compute_signals(
+    high,
+    low,
+    close,
+    volume,
+    rsi_period: int = 14,
+    tema_period: int = 9,
+    bb_window: int = 20,
+    bb_stds: float = 2.0,
+    entry_rsi_threshold: int = 30,
+    exit_rsi_threshold: int = 70,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Entry and exit masks straight from OHLCV arrays, without pandas.
+
+    Runs the indicator kernels and both signal checks on raw ndarrays in
+    one call — the per-candle loop of a backtest or parameter sweep.
+    Equivalent to computing rsi/tema/bollinger_bands and calling
+    check_entry_long/check_exit_long, minus every intermediate Series.
+
+    The period/window keyword names match a strategy's "indicators"
+    config, so `compute_signals(h, l, c, v, **strategy["indicators"])`
+    works.
+
+    Args:
+        high, low, close, volume: Array-likes of equal length.
+        rsi_period: RSI lookback period.
+        tema_period: TEMA period.
+        bb_window: Bollinger Band SMA window.
+        bb_stds: Bollinger Band standard deviation multiplier.
+        entry_rsi_threshold: RSI level to cross above for entry.
+        exit_rsi_threshold: RSI level to cross above for exit.
+
+    Returns:
+        Tuple of (entry, exit) boolean arrays.
+    """
+    close = _as_array(close)
+    r = _rsi_np(close, rsi_period)
+    t = _tema_np(close, tema_period)
+    _, m, _ = _bollinger_np(_as_array(high), _as_array(low), close, bb_window, bb_stds)
+    v = _as_array(volume)
+
     return (
-        crossed_above(rsi, rsi_threshold)
-        & (tema > bb_middle)
-        & (tema < tema.shift(1))
-        & (volume > 0)
+        _entry_mask(r, t, m, v, entry_rsi_threshold),
+        _exit_mask(r, t, m, v, exit_rsi_threshold),
     )
+
+
+# ---------------------------------------------------------------------------
+# Float32 column block (adapters keeping candle data in one buffer)
+# ---------------------------------------------------------------------------
+
+def _f32_columns(arr: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Column views of an (N, 4) Fortran-ordered float32 signal block."""
+    if (
+        arr.dtype != np.float32
+        or arr.ndim != 2
+        or arr.shape[1] != 4
+        or not arr.flags["F_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "Expected an (N, 4) Fortran-ordered float32 array with columns "
+            f"rsi, tema, bb_middle, volume; got {arr.dtype} {arr.shape}"
+        )
+    return arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+
+
+def check_entry_long_f32(arr: np.ndarray, rsi_threshold: int = 30) -> np.ndarray:
+    """
+    check_entry_long over a single float32 column block.
+
+    For adapters that keep rsi, tema, bb_middle and volume in one
+    preallocated (N, 4) buffer, e.g. np.empty((n, 4), np.float32,
+    order="F"): each column is contiguous, so the kernel reads it in place
+    at half the bandwidth of float64, with no per-bar conversion.
+
+    Comparisons are exact on the float32 values, so results equal the
+    float64 path run on the same (rounded) inputs. Values within float32
+    rounding of a threshold may flip relative to the original float64
+    indicators.
+
+    Args:
+        arr: (N, 4) F-contiguous float32 array of rsi, tema, bb_middle,
+            volume columns.
+        rsi_threshold: RSI level to cross above (default 30).
+
+    Returns:
+        Boolean array — True where entry signal fires.
+
+    Raises:
+        ValueError: If arr does not have the layout above.
+    """
+    return _entry_mask(*_f32_columns(arr), rsi_threshold)
+
+
+def check_exit_long_f32(arr: np.ndarray, rsi_threshold: int = 70) -> np.ndarray:
+    """
+    check_exit_long over a single float32 column block.
+
+    Same layout and caveats as check_entry_long_f32 (default
+    rsi_threshold 70).
+
+    Returns:
+        Boolean array — True where exit signal fires.
+    """
+    return _exit_mask(*_f32_columns(arr), rsi_threshold)
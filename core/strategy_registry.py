@@ -8,10 +8,28 @@ These definitions are consumed by execution-engine adapters (Freqtrade,
 Polymarket, backtester, etc.) — the adapters read from here rather than
 hardcoding parameters.
 
+The registry is frozen at import (read-only mappings all the way down), so
+configs can be shared across threads and adapters without defensive copies.
+
 No Freqtrade imports permitted in this file.
 """
 
-STRATEGIES = {
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional fast path
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+_STRATEGY_DEFINITIONS = {
     "momentum_rsi_bb": {
         "description": (
             "RSI + TEMA + Bollinger Bands momentum strategy. "
@@ -46,27 +64,81 @@ STRATEGIES = {
 }
 
 
-def get_strategy(name: str) -> dict:
+def _freeze(value: Any) -> Any:
+    """Recursively copy dicts into read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+STRATEGIES: Mapping[str, Mapping[str, Any]] = _freeze(_STRATEGY_DEFINITIONS)
+
+_AVAILABLE = ", ".join(STRATEGIES)
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively copy read-only mappings back into plain dicts."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+# Serialized once at import so adapters publishing configs across process
+# boundaries send ready-made bytes instead of re-encoding per call.
+_STRATEGY_JSON: Mapping[str, bytes] = MappingProxyType(
+    {name: _dumps(_thaw(cfg)) for name, cfg in STRATEGIES.items()}
+)
+
+
+@lru_cache(maxsize=None)
+def get_strategy(name: str) -> Mapping[str, Any]:
     """
     Retrieve a strategy configuration by name.
 
+    Memoized: safe because STRATEGIES is frozen at import. Anything that
+    swaps the registry at runtime (e.g. tests) must call
+    get_strategy.cache_clear(). Misses are not cached.
+
     Args:
         name: Strategy identifier (must exist in STRATEGIES).
 
     Returns:
-        Strategy configuration dict.
+        Read-only strategy configuration mapping.
 
     Raises:
         KeyError: If strategy name not found.
     """
     if name not in STRATEGIES:
-        available = ", ".join(STRATEGIES.keys())
         raise KeyError(
-            f"Strategy '{name}' not found. Available: {available}"
+            f"Strategy '{name}' not found. Available: {_AVAILABLE}"
         )
     return STRATEGIES[name]
 
 
+def get_strategy_json(name: str) -> bytes:
+    """
+    Retrieve a strategy configuration as compact UTF-8 JSON.
+
+    Uses orjson when installed, otherwise the stdlib json module. Both emit
+    compact UTF-8 JSON that decodes to the same config, but the bytes may
+    differ (e.g. float formatting), so compare decoded values, not bytes.
+
+    Args:
+        name: Strategy identifier (must exist in STRATEGIES).
+
+    Returns:
+        JSON-encoded strategy configuration.
+
+    Raises:
+        KeyError: If strategy name not found.
+    """
+    if name not in _STRATEGY_JSON:
+        raise KeyError(
+            f"Strategy '{name}' not found. Available: {_AVAILABLE}"
+        )
+    return _STRATEGY_JSON[name]
+
+
 def list_strategies() -> list[str]:
     """Return list of all registered strategy names."""
-    return list(STRATEGIES.keys())
+    return list(STRATEGIES)
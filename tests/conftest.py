@@ -0,0 +1,79 @@
+"""
+Shared pytest configuration and fixtures for the ATS core tests.
+
+Puts the repository root on sys.path once for every test module.
+"""
+
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.performance.analyzer import PerformanceAnalyzer
+from core.performance.database import get_connection, release_connection
+from core.performance.trade_logger import TradeLogger
+
+
+# ---------------------------------------------------------------------------
+# Synthetic OHLCV data
+# ---------------------------------------------------------------------------
+
+def make_ohlcv(n: int = 200, seed: int = 42) -> pd.DataFrame:
+    """Generate realistic-ish synthetic OHLCV data."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    high = close + rng.uniform(0.1, 1.0, n)
+    low = close - rng.uniform(0.1, 1.0, n)
+    open_ = close + rng.normal(0, 0.3, n)
+    volume = rng.uniform(1000, 50000, n)
+    return pd.DataFrame({
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    })
+
+
+@pytest.fixture(scope="session")
+def ohlcv():
+    """Deterministic and shared: tests must copy before mutating."""
+    return make_ohlcv()
+
+
+# ---------------------------------------------------------------------------
+# Performance database
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def db_path():
+    """One in-memory database shared by the whole test session."""
+    return f"file:ats_test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def db_conn(db_path):
+    conn = get_connection(db_path)  # Keeps the in-memory database alive
+    yield conn
+    release_connection(conn)
+
+
+@pytest.fixture
+def logger(db_path, db_conn):
+    # Per test, so cached entry regimes never leak between tests; the
+    # shared connection makes construction free.
+    tl = TradeLogger(db_path=db_path)
+    yield tl
+    tl.close()
+
+
+@pytest.fixture
+def analyzer(db_path):
+    a = PerformanceAnalyzer(db_path=db_path)
+    yield a
+    a.close()
@@ -8,39 +8,8 @@ ranges, and behaviors without any Freqtrade dependency.
 import pytest
 import pandas as pd
 import numpy as np
-import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from core.indicators import rsi, tema, bollinger_bands, crossed_above
-
-
-# ---------------------------------------------------------------------------
-# Fixtures — synthetic OHLCV data
-# ---------------------------------------------------------------------------
-
-def make_ohlcv(n: int = 200, seed: int = 42) -> pd.DataFrame:
-    """Generate realistic-ish synthetic OHLCV data."""
-    rng = np.random.default_rng(seed)
-    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
-    high = close + rng.uniform(0.1, 1.0, n)
-    low = close - rng.uniform(0.1, 1.0, n)
-    open_ = close + rng.normal(0, 0.3, n)
-    volume = rng.uniform(1000, 50000, n)
-    return pd.DataFrame({
-        "open": open_,
-        "high": high,
-        "low": low,
-        "close": close,
-        "volume": volume,
-    })
-
-
-@pytest.fixture
-def ohlcv():
-    return make_ohlcv()
+from core.indicators import rsi, tema, bollinger_bands, crossed_above, clear_cache
 
 
 # ---------------------------------------------------------------------------
@@ -69,6 +38,56 @@ class TestRSI:
         assert not r14.equals(r7)
 
 
+    def test_repeated_call_is_unaffected_by_caller_edits(self, ohlcv):
+        first = rsi(ohlcv["close"])
+        expected = first.copy()
+        first.iloc[-1] = -1.0
+        pd.testing.assert_series_equal(rsi(ohlcv["close"]), expected)
+
+    def test_clear_cache_picks_up_in_place_edits(self, ohlcv):
+        close = ohlcv["close"].to_numpy().copy()
+        before = rsi(pd.Series(close))
+        close[100] += 10.0  # In-place edit keeps address, length and ends
+        clear_cache()
+        after = rsi(pd.Series(close))
+        assert not before.equals(after)
+
+    def test_changed_buffer_is_recomputed(self, ohlcv):
+        close = ohlcv["close"].to_numpy().copy()
+        before = rsi(pd.Series(close))
+        close[-1] += 10.0  # Same address and length, new last value
+        after = rsi(pd.Series(close))
+        assert after.iloc[-1] != before.iloc[-1]
+        pd.testing.assert_series_equal(after, rsi(pd.Series(close.copy())))
+
+    def test_nan_endpoint_hits_cache(self, ohlcv):
+        import core.indicators as indicators
+        clear_cache()
+        close = ohlcv["close"].copy()
+        close.iloc[0] = np.nan
+        for _ in range(5):
+            rsi(close)
+        assert len(indicators._cache) == 1
+
+    def test_converted_input_is_not_cached(self, ohlcv):
+        import core.indicators as indicators
+        clear_cache()
+        rsi(ohlcv["close"].astype(np.float32))
+        assert indicators._cache == {}
+
+    def test_entry_dropped_with_its_buffer(self, ohlcv):
+        import gc
+        import core.indicators as indicators
+        clear_cache()
+        frame = ohlcv.copy()
+        rsi(frame["close"])
+        assert len(indicators._cache) == 1
+        del frame
+        gc.collect()
+        assert indicators._cache == {}
+        assert indicators._cache_bytes == 0
+
+
 # ---------------------------------------------------------------------------
 # TEMA Tests
 # ---------------------------------------------------------------------------
@@ -94,6 +113,15 @@ class TestTEMA:
 # Bollinger Bands Tests
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(params=["numba", "talib"])
+def bollinger_path(request, monkeypatch):
+    """Run a test on the numba kernel (when installed) and the ta-lib fallback."""
+    if request.param == "talib":
+        import core.indicators as indicators
+        monkeypatch.setattr(indicators, "_bollinger_nb", None)
+    return request.param
+
+
 class TestBollingerBands:
     def test_output_shapes(self, ohlcv):
         upper, mid, lower = bollinger_bands(
@@ -126,6 +154,29 @@ class TestBollingerBands:
             check_names=False,
         )
 
+    def test_bands_match_rolling_std(self, ohlcv, bollinger_path):
+        """Upper/lower bands use the sample std, like qtpylib's rolling_std."""
+        upper, mid, lower = bollinger_bands(
+            ohlcv["high"], ohlcv["low"], ohlcv["close"], window=20, stds=2.0
+        )
+        typical = (ohlcv["high"] + ohlcv["low"] + ohlcv["close"]) / 3.0
+        std = typical.rolling(window=20, min_periods=20).std()
+        expected_mid = typical.rolling(window=20, min_periods=20).mean()
+        pd.testing.assert_series_equal(upper, expected_mid + 2.0 * std, check_names=False)
+        pd.testing.assert_series_equal(lower, expected_mid - 2.0 * std, check_names=False)
+
+    def test_nan_gap_matches_rolling(self, ohlcv, bollinger_path):
+        """Windows that contain a NaN are NaN, as with min_periods=window."""
+        close = ohlcv["close"].copy()
+        close.iloc[[50, 60, 120]] = np.nan  # Includes a gap shorter than window
+        upper, mid, lower = bollinger_bands(ohlcv["high"], ohlcv["low"], close)
+        typical = (ohlcv["high"] + ohlcv["low"] + close) / 3.0
+        expected_mid = typical.rolling(window=20, min_periods=20).mean()
+        std = typical.rolling(window=20, min_periods=20).std()
+        pd.testing.assert_series_equal(mid, expected_mid, check_names=False)
+        pd.testing.assert_series_equal(upper, expected_mid + 2.0 * std, check_names=False)
+        pd.testing.assert_series_equal(lower, expected_mid - 2.0 * std, check_names=False)
+
 
 # ---------------------------------------------------------------------------
 # crossed_above Tests
@@ -147,27 +198,19 @@ class TestCrossedAbove:
         result = crossed_above(s, 30)
         assert result.sum() == 0  # Never crosses, always above
 
-    def test_series_crossover(self):
-        """Detects cross above another series."""
-        a = pd.Series([10, 20, 30, 25])
-        b = pd.Series([15, 25, 20, 30])
-        result = crossed_above(a, b)
-        # Index 2: 30 > 20 and 20 <= 25 → True
-        assert result.iloc[2] == True
-
-
-# ---------------------------------------------------------------------------
-# Integration: no Freqtrade imports
-# ---------------------------------------------------------------------------
-
-class TestNoFreqtradeDependency:
-    def test_no_freqtrade_in_indicators(self):
-        """Verify indicators.py has no Freqtrade imports."""
-        import core.indicators as mod
-        source_file = mod.__file__
-        with open(source_file) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
-        assert "import qtpylib" not in source
-        assert "from technical" not in source
+    def test_no_crossover_out_of_nan(self):
+        """A NaN bar (e.g. RSI warm-up) is not "below" the threshold."""
+        s = pd.Series([np.nan, 31.0, 29.0, 32.0])
+        result = crossed_above(s, 30)
+        assert result.tolist() == [False, False, False, True]
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_series_crossover_matches_oracle(self, seed):
+        """Cross above another series, checked against a NumPy oracle."""
+        rng = np.random.default_rng(seed)
+        a = rng.normal(size=1000)
+        b = rng.normal(size=1000)
+        cur = a > b
+        oracle = np.concatenate([[False], cur[1:] & ~cur[:-1]])
+        out = crossed_above(pd.Series(a), pd.Series(b)).to_numpy()
+        np.testing.assert_array_equal(out, oracle)
@@ -0,0 +1,38 @@
+"""
+Tests that core modules stay free of Freqtrade imports.
+
+Source files are read without importing them, so the check also covers
+the optional numba kernel modules.
+"""
+
+import importlib.util
+import pathlib
+
+import pytest
+
+
+CORE_MODULES = (
+    "core.indicators",
+    "core._indicators_nb",
+    "core.signals",
+    "core._signals_nb",
+    "core.strategy_registry",
+    "core.performance.database",
+    "core.performance.trade_logger",
+    "core.performance.analyzer",
+    "core.performance.regime",
+)
+
+FORBIDDEN = (
+    "import freqtrade",
+    "from freqtrade",
+    "import qtpylib",
+    "from technical",
+)
+
+
+@pytest.mark.parametrize("mod_name", CORE_MODULES)
+def test_no_freqtrade(mod_name):
+    source = pathlib.Path(importlib.util.find_spec(mod_name).origin).read_text()
+    for token in FORBIDDEN:
+        assert token not in source
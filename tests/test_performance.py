@@ -1,58 +1,56 @@
 """
 Tests for core.performance.trade_logger and core.performance.analyzer modules.
 
-Uses in-memory SQLite database for test isolation.
+Uses one shared in-memory SQLite database per session, emptied after each
+test.
 """
 
 import pytest
-import os
-import sys
-import tempfile
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import uuid
+from types import MappingProxyType
 
 from core.performance.trade_logger import TradeLogger
-from core.performance.analyzer import PerformanceAnalyzer
-
-
-@pytest.fixture
-def db_path():
-    """Create a temporary database for each test."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
-    yield path
-    os.unlink(path)
+from core.performance.database import get_connection, release_connection
 
 
-@pytest.fixture
-def logger(db_path):
-    tl = TradeLogger(db_path=db_path)
-    yield tl
-    tl.close()
-
-
-@pytest.fixture
-def analyzer(db_path):
-    a = PerformanceAnalyzer(db_path=db_path)
-    yield a
-    a.close()
+@pytest.fixture(autouse=True)
+def clean_tables(db_conn):
+    """Empty the shared database after each test."""
+    yield
+    db_conn.execute("DELETE FROM trade_log")
+    db_conn.execute("DELETE FROM regime_snapshots")
+    db_conn.commit()
 
 
 # ---------------------------------------------------------------------------
 # Sample data helpers
 # ---------------------------------------------------------------------------
 
-def sample_indicators(rsi=45, tema=100, bb_percent=0.5, bb_width=0.04, adx=25):
-    return {
-        "rsi": rsi,
-        "tema": tema,
-        "bb_percent": bb_percent,
-        "bb_width": bb_width,
-        "adx": adx,
-    }
+_DEFAULT_INDICATORS = MappingProxyType({
+    "rsi": 45,
+    "tema": 100,
+    "bb_percent": 0.5,
+    "bb_width": 0.04,
+    "adx": 25,
+})
+
+_DEFAULT_REGIME = MappingProxyType({
+    "volatility": "medium",
+    "trend": "weak_trend",
+    "combined": "medium_weak_trend",
+})
+
+
+def sample_indicators(**overrides):
+    """Shared read-only defaults; a new dict only when overriding."""
+    if not overrides:
+        return _DEFAULT_INDICATORS
+    return {**_DEFAULT_INDICATORS, **overrides}
 
 
 def sample_regime(volatility="medium", trend="weak_trend"):
+    if volatility == "medium" and trend == "weak_trend":
+        return _DEFAULT_REGIME
     return {
         "volatility": volatility,
         "trend": trend,
@@ -90,6 +88,24 @@ def log_complete_trade(
     )
 
 
+def complete_trade_row(
+    trade_id, pair="BTC/USDT", strategy="momentum_rsi_bb",
+    entry_price=100.0, exit_price=103.0, exit_reason="roi",
+):
+    """Row for TradeLogger.log_trades_bulk matching log_complete_trade."""
+    entry, exit_ = sample_indicators(), sample_indicators(rsi=65)
+    regime = sample_regime()
+    return (
+        trade_id, pair, strategy, "2026-02-23T12:00:00", entry_price,
+        entry["rsi"], entry["tema"], entry["bb_percent"], entry["bb_width"],
+        entry["adx"], regime["volatility"], regime["trend"], regime["combined"],
+        "2026-02-23T13:00:00", exit_price, exit_reason,
+        exit_["rsi"], exit_["tema"], exit_["bb_percent"], exit_["bb_width"],
+        exit_["adx"], regime["volatility"], regime["trend"], regime["combined"],
+        60.0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # TradeLogger Tests
 # ---------------------------------------------------------------------------
@@ -156,7 +172,7 @@ class TestTradeLogger:
         )
 
         import sqlite3
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         conn.row_factory = sqlite3.Row
         row = conn.execute("SELECT * FROM trade_log WHERE trade_id = '1'").fetchone()
         assert row["pnl_absolute"] == 5.0
@@ -182,12 +198,62 @@ class TestTradeLogger:
         )
 
         import sqlite3
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         conn.row_factory = sqlite3.Row
         row = conn.execute("SELECT * FROM trade_log WHERE trade_id = '1'").fetchone()
         assert row["regime_changed"] == 1
         conn.close()
 
+    def test_exit_from_other_logger_uses_stored_regime(self, logger, db_path):
+        logger.log_entry(
+            trade_id="1", pair="BTC/USDT", strategy="momentum_rsi_bb",
+            entry_time="2026-02-23T12:00:00", entry_price=100.0,
+            indicators=sample_indicators(),
+            regime=sample_regime("low", "ranging"),
+        )
+        other = TradeLogger(db_path=db_path)  # No cached entry regime
+        assert other.log_exit(
+            trade_id="1",
+            exit_time="2026-02-23T13:00:00",
+            exit_price=103.0,
+            exit_reason="roi",
+            indicators=sample_indicators(),
+            regime=sample_regime("high", "strong_trend"),
+            entry_price=100.0,
+            duration_minutes=60.0,
+        ) is True
+        other.close()
+
+        import sqlite3
+        conn = sqlite3.connect(db_path, uri=True)
+        changed = conn.execute(
+            "SELECT regime_changed FROM trade_log WHERE trade_id = '1'"
+        ).fetchone()[0]
+        assert changed == 1
+        conn.close()
+
+    def test_exit_after_rolled_back_entry_returns_false(self, logger):
+        with pytest.raises(RuntimeError):
+            with logger.batch():
+                logger.log_entry(
+                    trade_id="1", pair="BTC/USDT", strategy="momentum_rsi_bb",
+                    entry_time="2026-02-23T12:00:00", entry_price=100.0,
+                    indicators=sample_indicators(),
+                    regime=sample_regime(),
+                )
+                raise RuntimeError("boom")
+        result = logger.log_exit(
+            trade_id="1",
+            exit_time="2026-02-23T13:00:00",
+            exit_price=103.0,
+            exit_reason="roi",
+            indicators=sample_indicators(),
+            regime=sample_regime(),
+            entry_price=100.0,
+            duration_minutes=60.0,
+        )
+        assert result is False
+
     def test_log_regime_snapshot(self, logger, db_path):
         logger.log_regime_snapshot(
             pair="BTC/USDT",
@@ -196,11 +262,196 @@ class TestTradeLogger:
             indicators=sample_indicators(),
         )
         import sqlite3
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         count = conn.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
         assert count == 1
         conn.close()
 
+    def test_batch_defers_commit(self, tmp_path):
+        # On disk: shared-cache memory databases lock tables instead of
+        # giving other connections a snapshot.
+        import sqlite3
+        db_path = str(tmp_path / "batch.db")
+        logger = TradeLogger(db_path=db_path)
+        conn = sqlite3.connect(db_path)
+        with logger.batch():
+            for ts in ("2026-02-23T12:00:00", "2026-02-23T12:05:00"):
+                logger.log_regime_snapshot(
+                    pair="BTC/USDT", timestamp=ts,
+                    regime=sample_regime(), indicators=sample_indicators(),
+                )
+            count = conn.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+            assert count == 0
+        count = conn.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+        assert count == 2
+        conn.close()
+        logger.close()
+
+    def test_batch_not_committed_by_other_logger(self, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "shared.db")
+        a, b = TradeLogger(db_path=db_path), TradeLogger(db_path=db_path)
+        reader = sqlite3.connect(db_path)
+        snapshot = dict(
+            pair="BTC/USDT", timestamp="2026-02-23T12:00:00",
+            regime=sample_regime(), indicators=sample_indicators(),
+        )
+        with pytest.raises(RuntimeError):
+            with a.batch():
+                a.log_regime_snapshot(**snapshot)
+                b.log_regime_snapshot(**snapshot)  # Must not commit a's row
+                count = reader.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+                assert count == 0
+                raise RuntimeError("boom")
+        count = reader.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+        assert count == 0
+        reader.close()
+        a.close()
+        b.close()
+
+    def test_nested_failure_keeps_other_loggers_batch(self, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "shared.db")
+        a, b = TradeLogger(db_path=db_path), TradeLogger(db_path=db_path)
+        snapshot = dict(
+            pair="BTC/USDT", timestamp="2026-02-23T12:00:00",
+            regime=sample_regime(), indicators=sample_indicators(),
+        )
+        with b.batch():
+            b.log_regime_snapshot(**snapshot)
+            with pytest.raises(RuntimeError):
+                with a.batch():
+                    a.log_regime_snapshot(**snapshot)
+                    raise RuntimeError("boom")
+            b.log_regime_snapshot(**snapshot)
+        reader = sqlite3.connect(db_path)
+        count = reader.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+        assert count == 2  # b's rows only
+        reader.close()
+        a.close()
+        b.close()
+
+    def test_batch_rolls_back_on_error(self, logger, db_path):
+        with pytest.raises(RuntimeError):
+            with logger.batch():
+                logger.log_regime_snapshot(
+                    pair="BTC/USDT", timestamp="2026-02-23T12:00:00",
+                    regime=sample_regime(), indicators=sample_indicators(),
+                )
+                raise RuntimeError("boom")
+        import sqlite3
+        conn = sqlite3.connect(db_path, uri=True)
+        count = conn.execute("SELECT COUNT(*) FROM regime_snapshots").fetchone()[0]
+        assert count == 0
+        conn.close()
+
+    def test_log_entries_bulk(self, logger):
+        rows = [
+            (str(i), "BTC/USDT", "momentum_rsi_bb", "2026-02-23T12:00:00", 100.0,
+             45, 100, 0.5, 0.04, 25, "medium", "weak_trend", "medium_weak_trend")
+            for i in range(5)
+        ]
+        assert logger.log_entries_bulk(rows) == 5
+        assert logger.find_open_trade("BTC/USDT") is not None
+
+    def test_log_trades_bulk_matches_entry_exit(self, logger, db_path):
+        log_complete_trade(logger, "1", entry_price=100.0, exit_price=105.0)
+        assert logger.log_trades_bulk(
+            [complete_trade_row("2", entry_price=100.0, exit_price=105.0)]
+        ) == 1
+
+        import sqlite3
+        conn = sqlite3.connect(db_path, uri=True)
+        rows = conn.execute(
+            "SELECT * FROM trade_log ORDER BY trade_id"
+        ).fetchall()
+        conn.close()
+        # Identical apart from id, trade_id and created_at
+        assert rows[0][2:-1] == rows[1][2:-1]
+
+    def test_log_regime_snapshots_bulk(self, logger):
+        rows = [
+            ("2026-02-23T12:00:00", "BTC/USDT", "medium", "weak_trend",
+             "medium_weak_trend", 0.04, 25, 45),
+        ] * 3
+        assert logger.log_regime_snapshots_bulk(rows) == 3
+
+
+# ---------------------------------------------------------------------------
+# Connection cache Tests
+# ---------------------------------------------------------------------------
+
+class TestConnectionCache:
+    # Own database: the session db_path is held open by db_conn
+    def test_same_path_shares_connection(self, tmp_path):
+        a = get_connection(str(tmp_path / "cache.db"))
+        b = get_connection(str(tmp_path / "cache.db"))
+        try:
+            assert a is b
+        finally:
+            release_connection(a)
+            release_connection(b)
+
+    def test_closed_after_last_release(self, tmp_path):
+        import sqlite3
+        a = get_connection(str(tmp_path / "cache.db"))
+        b = get_connection(str(tmp_path / "cache.db"))
+        release_connection(a)
+        b.execute("SELECT 1")  # Still open for the remaining user
+        release_connection(b)
+        with pytest.raises(sqlite3.ProgrammingError):
+            b.execute("SELECT 1")
+
+    def test_schema_ensured_once_per_file(self, tmp_path, monkeypatch):
+        import core.performance.database as database
+        calls = []
+        ensure = database._ensure_tables
+        monkeypatch.setattr(
+            database, "_ensure_tables", lambda conn: calls.append(1) or ensure(conn)
+        )
+        path = str(tmp_path / "cycles.db")
+        for _ in range(3):
+            logger = TradeLogger(db_path=path)
+            logger.find_open_trade("BTC/USDT")
+            logger.close()
+        assert len(calls) == 1
+
+    def test_memory_database_schema_recreated(self):
+        uri = f"file:ats_mem_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        for _ in range(2):  # Database vanishes with its last connection
+            conn = get_connection(uri)
+            conn.execute("SELECT COUNT(*) FROM trade_log")
+            release_connection(conn)
+
+    def test_analyze_skipped_when_stats_exist(self, tmp_path):
+        from core.performance.database import _ensure_tables
+        path = str(tmp_path / "stats.db")
+        conn = get_connection(path)
+        logger = TradeLogger(db_path=path)
+        logger.log_trades_bulk(complete_trade_row(str(i)) for i in range(5))
+        conn.execute("ANALYZE trade_log")
+        conn.commit()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        _ensure_tables(conn)
+        conn.set_trace_callback(None)
+        assert not any(s.startswith("ANALYZE") for s in statements)
+        logger.close()
+        release_connection(conn)
+
+    def test_uri_opened_as_is(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        uri = f"file:ats_uri_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        a = get_connection(uri)
+        b = get_connection(uri)
+        try:
+            assert a is b
+            a.execute("SELECT COUNT(*) FROM trade_log")  # Schema ensured
+        finally:
+            release_connection(a)
+            release_connection(b)
+        assert list(tmp_path.iterdir()) == []  # No file or directory created
+
 
 # ---------------------------------------------------------------------------
 # PerformanceAnalyzer Tests
@@ -224,6 +475,19 @@ class TestPerformanceAnalyzer:
         assert result["losses"] == 1
         assert result["win_rate"] == 0.75
 
+    def test_summary_metrics(self, logger, analyzer):
+        log_complete_trade(logger, "1", entry_price=100, exit_price=104)  # +4%
+        log_complete_trade(logger, "2", entry_price=100, exit_price=102)  # +2%
+        log_complete_trade(logger, "3", entry_price=100, exit_price=101)  # +1%
+        log_complete_trade(logger, "4", entry_price=100, exit_price=95)   # -5%
+
+        result = analyzer.summary()
+        assert result["avg_win_pct"] == pytest.approx(2.3333)
+        assert result["avg_loss_pct"] == -5.0
+        assert result["expectancy_pct"] == pytest.approx(0.5)
+        assert result["profit_factor"] == 1.4
+        assert result["avg_duration_min"] == 60.0
+
     def test_summary_filter_by_strategy(self, logger, analyzer):
         log_complete_trade(logger, "1", strategy="strat_a", exit_price=105)
         log_complete_trade(logger, "2", strategy="strat_b", exit_price=95)
@@ -255,8 +519,9 @@ class TestPerformanceAnalyzer:
 
     def test_decay_no_decay(self, logger, analyzer):
         # 70 consistently profitable trades
-        for i in range(70):
-            log_complete_trade(logger, str(i), exit_price=103)
+        logger.log_trades_bulk(
+            complete_trade_row(str(i), exit_price=103) for i in range(70)
+        )
 
         result = analyzer.detect_decay(
             "momentum_rsi_bb", recent_window=20, baseline_window=50
@@ -264,6 +529,18 @@ class TestPerformanceAnalyzer:
         assert result["has_enough_data"] is True
         assert result["decay_detected"] is False
 
+    def test_decay_windows_bounded(self, logger, analyzer):
+        logger.log_trades_bulk(
+            complete_trade_row(str(i), exit_price=103) for i in range(80)
+        )
+
+        result = analyzer.detect_decay(
+            "momentum_rsi_bb", recent_window=20, baseline_window=50
+        )
+        assert result["total_closed_trades"] == 80
+        assert result["recent"]["total_trades"] == 20
+        assert result["baseline"]["total_trades"] == 50
+
     def test_recent_trades(self, logger, analyzer):
         log_complete_trade(logger, "1")
         log_complete_trade(logger, "2")
@@ -272,25 +549,38 @@ class TestPerformanceAnalyzer:
         result = analyzer.recent_trades(n=2)
         assert len(result) == 2
 
+    def test_to_numpy_columns(self, logger, analyzer):
+        log_complete_trade(logger, "1", strategy="strat_a", exit_price=105)
+        log_complete_trade(logger, "2", strategy="strat_b", exit_price=95)
+        logger.log_entry(
+            trade_id="3", pair="BTC/USDT", strategy="strat_a",
+            entry_time="2026-02-23T14:00:00", entry_price=100.0,
+            indicators=sample_indicators(), regime=sample_regime(),
+        )  # Still open: excluded
+
+        cols = analyzer.to_numpy()
+        assert cols["pnl_percent"].tolist() == [5.0, -5.0]
+        assert analyzer.to_numpy(strategy="strat_a")["pnl_percent"].tolist() == [5.0]
 
-class TestNoFreqtradeDependency:
-    def test_no_freqtrade_in_trade_logger(self):
-        import core.performance.trade_logger as mod
-        with open(mod.__file__) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
-
-    def test_no_freqtrade_in_analyzer(self):
-        import core.performance.analyzer as mod
-        with open(mod.__file__) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
-
-    def test_no_freqtrade_in_database(self):
-        import core.performance.database as mod
-        with open(mod.__file__) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
+    def test_to_numpy_drops_rolled_back_batch(self, logger, analyzer):
+        log_complete_trade(logger, "1")
+        with pytest.raises(RuntimeError):
+            with logger.batch():
+                log_complete_trade(logger, "2")
+                assert len(analyzer.to_numpy()["pnl_percent"]) == 2
+                raise RuntimeError("boom")
+        assert analyzer.summary()["total_trades"] == 1
+        assert len(analyzer.to_numpy()["pnl_percent"]) == 1
+
+    def test_to_numpy_arrays_are_read_only(self, logger, analyzer):
+        log_complete_trade(logger, "1")
+        cols = analyzer.to_numpy()
+        with pytest.raises(ValueError):
+            cols["pnl_percent"][0] = 99.0
+        assert analyzer.to_numpy()["pnl_percent"][0] == 3.0
+
+    def test_to_numpy_refreshes_after_write(self, logger, analyzer):
+        log_complete_trade(logger, "1")
+        assert len(analyzer.to_numpy()["pnl_percent"]) == 1
+        log_complete_trade(logger, "2")
+        assert len(analyzer.to_numpy()["pnl_percent"]) == 2
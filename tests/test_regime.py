@@ -2,13 +2,19 @@
 Tests for core.performance.regime module.
 """
 
-import pytest
-import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+import numpy as np
 
-from core.performance.regime import classify_volatility, classify_trend, classify_regime
+from core.performance.regime import (
+    classify_volatility,
+    classify_trend,
+    classify_trend_bulk,
+    classify_regime,
+    PSquareQuantile,
+    VolatilityRegimeState,
+)
 
 
 class TestClassifyVolatility:
@@ -35,6 +41,93 @@ class TestClassifyVolatility:
         result = classify_volatility(50, [50])
         assert result == "unknown"
 
+    def test_accepts_ndarray_history(self):
+        history = np.arange(10, 110, dtype=np.float64)
+        assert classify_volatility(15, history) == "low"
+        assert classify_volatility(55, history) == "medium"
+        assert classify_volatility(95, history[:100]) == "high"
+        assert classify_volatility(50, np.empty(0)) == "unknown"
+
+
+class TestPSquareQuantile:
+    def test_exact_before_five_values(self):
+        q = PSquareQuantile(0.5)
+        for x in (3.0, 1.0, 2.0):
+            q.update(x)
+        assert q.quantile() == 2.0
+
+    def test_tracks_quantiles_of_stream(self):
+        values = np.random.default_rng(0).uniform(0, 100, 5000)
+        for p in (0.25, 0.75):
+            q = PSquareQuantile(p)
+            for x in values:
+                q.update(x)
+            assert abs(q.quantile() - np.quantile(values, p)) < 1.0
+
+    def test_rejects_out_of_range(self):
+        with pytest.raises(ValueError):
+            PSquareQuantile(1.5)
+
+
+class TestVolatilityRegimeState:
+    def test_matches_classify_volatility_during_warmup(self):
+        values = np.random.default_rng(1).uniform(0.01, 0.1, 20)
+        state = VolatilityRegimeState(warmup=20)
+        history = []
+        for x in values:
+            assert state.update(x) == classify_volatility(x, history)
+            history.append(x)
+
+    def test_streaming_classification(self):
+        state = VolatilityRegimeState()
+        for x in range(10, 110):
+            state.add(x)
+        assert state.classify(15) == "low"
+        assert state.classify(55) == "medium"
+        assert state.classify(95) == "high"
+
+    def test_unknown_until_two_values(self):
+        state = VolatilityRegimeState()
+        assert state.update(50) == "unknown"
+        assert state.update(np.nan) == "unknown"  # NaN is not added
+        assert state.count == 1
+
+    def test_exact_matches_classify_volatility(self):
+        values = np.random.default_rng(2).uniform(0.01, 0.1, 500)
+        state = VolatilityRegimeState(exact=True)
+        for i, x in enumerate(values):
+            assert state.update(x) == classify_volatility(x, values[:i])
+        assert state.thresholds() == tuple(np.percentile(values, [25, 75]))
+
+    def test_exact_thresholds_match_numpy_percentiles(self):
+        values = np.random.default_rng(4).uniform(0.01, 0.1, 250)
+        pcts = np.random.default_rng(5).uniform(0, 100, 200)
+        for low, high in zip(pcts[::2], pcts[1::2]):
+            state = VolatilityRegimeState(low, high, exact=True)
+            for x in values:
+                state.add(x)
+            assert state.thresholds() == tuple(np.percentile(values, [low, high]))
+
+    @pytest.mark.skipif(
+        not os.environ.get("ATS_BENCH"), reason="benchmark; set ATS_BENCH=1"
+    )
+    def test_exact_state_outpaces_batch(self):
+        """Bench: 5k bars, stateful sorted inserts vs per-bar percentiles."""
+        import time
+        values = np.random.default_rng(3).uniform(0.01, 0.1, 5000)
+
+        start = time.perf_counter()
+        state = VolatilityRegimeState(exact=True)
+        streamed = [state.update(x) for x in values]
+        stateful = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = [classify_volatility(x, values[:i]) for i, x in enumerate(values)]
+        batched = time.perf_counter() - start
+
+        assert streamed == batch
+        assert stateful < batched
+
 
 class TestClassifyTrend:
     def test_ranging(self):
@@ -59,6 +152,21 @@ class TestClassifyTrend:
     def test_none_returns_unknown(self):
         assert classify_trend(None) == "unknown"
 
+    def test_numpy_scalar(self):
+        assert classify_trend(np.float64(35)) == "strong_trend"
+        assert classify_trend(np.int64(25)) == "weak_trend"
+
+
+class TestClassifyTrendBulk:
+    def test_matches_scalar(self):
+        adx = np.array([0, 15, 19.99, 20, 25, 29.99, 30, 35, 100, np.nan])
+        expected = [classify_trend(x) for x in adx]
+        assert classify_trend_bulk(adx).tolist() == expected
+
+    def test_scalar_input(self):
+        assert classify_trend_bulk(25.0) == "weak_trend"
+        assert classify_trend_bulk(np.float64("nan")) == "unknown"
+
 
 class TestClassifyRegime:
     def test_combined_label(self):
@@ -80,11 +188,8 @@ class TestClassifyRegime:
         assert "trend" in result
         assert "combined" in result
 
-
-class TestNoFreqtradeDependency:
-    def test_no_freqtrade_in_regime(self):
-        import core.performance.regime as mod
-        with open(mod.__file__) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
+    def test_combined_label_is_shared(self):
+        history = list(range(10, 110))
+        a = classify_regime(bb_width=15, bb_width_history=history, adx=10)
+        b = classify_regime(bb_width=12, bb_width_history=history, adx=12)
+        assert a["combined"] is b["combined"]
@@ -11,9 +11,21 @@ import numpy as np
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from core.signals import check_entry_long, check_exit_long
+from core.indicators import rsi, tema, bollinger_bands
+from core.signals import (
+    check_entry_long,
+    check_exit_long,
+    check_entry_long_last,
+    check_exit_long_last,
+    check_entry_long_arr,
+    check_exit_long_arr,
+    check_entry_long_f32,
+    check_exit_long_f32,
+    compute_signals,
+    make_entry_checker,
+    make_exit_checker,
+    make_signal_arrays,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -134,16 +146,178 @@ class TestExitSignal:
 
 
 # ---------------------------------------------------------------------------
-# Integration: no Freqtrade imports
+# Equivalence with the pandas reference expressions
 # ---------------------------------------------------------------------------
 
-class TestNoFreqtradeDependency:
-    def test_no_freqtrade_in_signals(self):
-        """Verify signals.py has no Freqtrade imports."""
-        import core.signals as mod
-        with open(mod.__file__) as f:
-            source = f.read()
-        assert "import freqtrade" not in source
-        assert "from freqtrade" not in source
-        assert "import qtpylib" not in source
-        assert "from technical" not in source
+def make_indicator_frame(n: int = 2000, seed: int = 7) -> tuple:
+    """Oscillating synthetic prices so both signals fire a few times."""
+    rng = np.random.default_rng(seed)
+    close = pd.Series(100 + 5 * np.sin(np.arange(n) / 15) + rng.normal(0, 0.5, n))
+    high = close + rng.uniform(0.1, 1.0, n)
+    low = close - rng.uniform(0.1, 1.0, n)
+    volume = pd.Series(rng.uniform(0, 5000, n))
+    volume.iloc[::50] = 0.0
+    return high, low, close, volume
+
+
+def reference_entry(r, t, m, v, thr=30):
+    """The original pandas expression for check_entry_long."""
+    return (r > thr) & (r.shift(1) <= thr) & (t <= m) & (t > t.shift(1)) & (v > 0)
+
+
+def reference_exit(r, t, m, v, thr=70):
+    """The original pandas expression for check_exit_long."""
+    return (r > thr) & (r.shift(1) <= thr) & (t > m) & (t < t.shift(1)) & (v > 0)
+
+
+class TestMatchesReference:
+    def test_series_api(self):
+        high, low, close, volume = make_indicator_frame()
+        r, t = rsi(close), tema(close)
+        _, mid, _ = bollinger_bands(high, low, close)
+
+        entry = check_entry_long(r, t, mid, volume)
+        exit_ = check_exit_long(r, t, mid, volume)
+        pd.testing.assert_series_equal(entry, reference_entry(r, t, mid, volume))
+        pd.testing.assert_series_equal(exit_, reference_exit(r, t, mid, volume))
+        assert entry.any() and exit_.any()
+
+    def test_unaligned_inputs_are_aligned_by_pandas(self):
+        """Series on different indexes fall back to pandas alignment."""
+        high, low, close, volume = make_indicator_frame()
+        r, t = rsi(close), tema(close)
+        _, mid, _ = bollinger_bands(high, low, close)
+        shuffled = volume.sample(frac=1.0, random_state=0)
+
+        pd.testing.assert_series_equal(
+            check_entry_long(r, t, mid, shuffled),
+            reference_entry(r, t, mid, volume),
+        )
+        pd.testing.assert_series_equal(
+            check_exit_long(r, t, mid, shuffled),
+            reference_exit(r, t, mid, volume),
+        )
+
+    def test_shared_signal_arrays(self):
+        high, low, close, volume = make_indicator_frame()
+        r, t = rsi(close), tema(close)
+        _, mid, _ = bollinger_bands(high, low, close)
+
+        arrays = make_signal_arrays(r, t, mid, volume)
+        pd.testing.assert_series_equal(
+            check_entry_long_arr(arrays), reference_entry(r, t, mid, volume)
+        )
+        pd.testing.assert_series_equal(
+            check_exit_long_arr(arrays), reference_exit(r, t, mid, volume)
+        )
+
+    def test_compute_signals(self):
+        """compute_signals agrees with indicators + the pandas reference."""
+        high, low, close, volume = make_indicator_frame()
+        r, t = rsi(close), tema(close)
+        _, mid, _ = bollinger_bands(high, low, close)
+
+        entry, exit_ = compute_signals(high, low, close, volume)
+        np.testing.assert_array_equal(entry, reference_entry(r, t, mid, volume).to_numpy())
+        np.testing.assert_array_equal(exit_, reference_exit(r, t, mid, volume).to_numpy())
+
+    def test_last_candle_variants(self):
+        """Per-candle checks agree with the vectorized masks on every bar."""
+        high, low, close, volume = make_indicator_frame(n=500)
+        r, t = rsi(close).to_numpy(), tema(close).to_numpy()
+        _, mid, _ = bollinger_bands(high, low, close)
+        m, v = mid.to_numpy(), volume.to_numpy()
+        entry, exit_ = compute_signals(high, low, close, volume)
+
+        for i in range(1, len(r)):
+            args = (r[i - 1], r[i], t[i - 1], t[i], m[i], v[i])
+            assert check_entry_long_last(*args) == entry[i]
+            assert check_exit_long_last(*args) == exit_[i]
+
+    def test_bound_checkers(self):
+        """Checkers with a pre-bound threshold match the Series API."""
+        high, low, close, volume = make_indicator_frame()
+        r, t = rsi(close), tema(close)
+        _, mid, _ = bollinger_bands(high, low, close)
+        arrays = (r.to_numpy(), t.to_numpy(), mid.to_numpy(), volume.to_numpy())
+
+        for thr in (30, 35):
+            np.testing.assert_array_equal(
+                make_entry_checker(thr)(*arrays),
+                check_entry_long(r, t, mid, volume, rsi_threshold=thr).to_numpy(),
+            )
+        np.testing.assert_array_equal(
+            make_exit_checker()(*arrays),
+            check_exit_long(r, t, mid, volume).to_numpy(),
+        )
+
+    def test_bound_checkers_accept_strided_inputs(self):
+        high, low, close, volume = make_indicator_frame(n=400)
+        r, t = rsi(close).to_numpy(), tema(close).to_numpy()
+        _, mid, _ = bollinger_bands(high, low, close)
+        m, v = mid.to_numpy(), volume.to_numpy().astype(np.int64)
+        strided = (r[::2], t[::2], m[::2], v[::2])
+        assert not strided[0].flags["C_CONTIGUOUS"]
+
+        contiguous = [np.array(a, dtype=np.float64) for a in strided]
+        np.testing.assert_array_equal(
+            make_entry_checker()(*strided), make_entry_checker()(*contiguous)
+        )
+
+    def test_float32_block(self):
+        """The float32 block path equals the Series path on the same values."""
+        high, low, close, volume = make_indicator_frame(n=500)
+        _, mid, _ = bollinger_bands(high, low, close)
+        block = np.asfortranarray(
+            np.column_stack([rsi(close), tema(close), mid, volume]), dtype=np.float32
+        )
+        r, t, m, v = (pd.Series(block[:, i].astype(np.float64)) for i in range(4))
+
+        # 30.1 and 70.3 are not exact in float32, so they catch a threshold
+        # rounded to the block's dtype.
+        for entry_thr, exit_thr in ((30, 70), (30.1, 70.3)):
+            np.testing.assert_array_equal(
+                check_entry_long_f32(block, entry_thr),
+                reference_entry(r, t, m, v, entry_thr).to_numpy(),
+            )
+            np.testing.assert_array_equal(
+                check_exit_long_f32(block, exit_thr),
+                reference_exit(r, t, m, v, exit_thr).to_numpy(),
+            )
+
+        # float32(30.1) and float32(70.3) lie just above their thresholds, so
+        # both cross when compared in float64.
+        edge = np.asfortranarray(
+            [[29.0, 1.0, 5.0, 1.0], [30.1, 2.0, 5.0, 1.0]], dtype=np.float32
+        )
+        np.testing.assert_array_equal(check_entry_long_f32(edge, 30.1), [False, True])
+        edge[:, 0] = [69.0, 70.3]
+        edge[:, 1] = [7.0, 6.0]
+        np.testing.assert_array_equal(check_exit_long_f32(edge, 70.3), [False, True])
+
+    def test_float32_block_layout_checked(self):
+        block = np.zeros((10, 4), dtype=np.float32)  # C order
+        with pytest.raises(ValueError, match="Fortran-ordered"):
+            check_entry_long_f32(block)
+        with pytest.raises(ValueError, match="float32"):
+            check_exit_long_f32(np.zeros((10, 4), order="F"))
+
+    def test_numpy_fallback(self, monkeypatch):
+        """The NumPy path (no numba) gives the same masks."""
+        import core.signals as signals
+        monkeypatch.setattr(signals, "_entry_nb", None)
+        monkeypatch.setattr(signals, "_exit_nb", None)
+        self.test_series_api()
+        self.test_float32_block()
+
+    def test_jit_can_be_disabled(self):
+        """ATS_DISABLE_JIT skips importing numba entirely."""
+        import subprocess
+        code = (
+            "import sys, core.signals as s, core.indicators as i; "
+            "assert s._entry_nb is None and i._bollinger_nb is None; "
+            "assert 'numba' not in sys.modules"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, ATS_DISABLE_JIT="1")
+        subprocess.run([sys.executable, "-c", code], cwd=root, env=env, check=True)
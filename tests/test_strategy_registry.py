@@ -0,0 +1,59 @@
+"""
+Tests for core.strategy_registry module.
+"""
+
+import json
+import pytest
+
+from core.strategy_registry import (
+    STRATEGIES,
+    get_strategy,
+    get_strategy_json,
+    list_strategies,
+)
+
+
+class TestGetStrategy:
+    def test_known_strategy(self):
+        strategy = get_strategy("momentum_rsi_bb")
+        assert strategy["indicators"]["rsi_period"] == 14
+        assert strategy["risk"]["minimal_roi"]["0"] == 0.04
+
+    def test_unknown_strategy_lists_available(self):
+        with pytest.raises(KeyError, match="momentum_rsi_bb"):
+            get_strategy("does_not_exist")
+
+    def test_repeated_lookup_returns_same_config(self):
+        assert get_strategy("momentum_rsi_bb") is get_strategy("momentum_rsi_bb")
+
+    def test_list_strategies(self):
+        assert list_strategies() == ["momentum_rsi_bb"]
+
+
+class TestFrozenRegistry:
+    def test_top_level_is_read_only(self):
+        with pytest.raises(TypeError):
+            STRATEGIES["new"] = {}
+
+    def test_nested_configs_are_read_only(self):
+        strategy = get_strategy("momentum_rsi_bb")
+        with pytest.raises(TypeError):
+            strategy["indicators"]["rsi_period"] = 7
+        with pytest.raises(TypeError):
+            strategy["risk"]["minimal_roi"]["0"] = 1.0
+
+
+class TestStrategyJson:
+    def test_round_trips_to_config(self):
+        data = json.loads(get_strategy_json("momentum_rsi_bb"))
+        assert data["indicators"]["bb_stds"] == 2.0
+        assert data["risk"]["minimal_roi"] == {"0": 0.04, "30": 0.02, "60": 0.01}
+
+    def test_is_precomputed_bytes(self):
+        payload = get_strategy_json("momentum_rsi_bb")
+        assert isinstance(payload, bytes)
+        assert get_strategy_json("momentum_rsi_bb") is payload
+
+    def test_unknown_strategy_raises(self):
+        with pytest.raises(KeyError, match="momentum_rsi_bb"):
+            get_strategy_json("does_not_exist")